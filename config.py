@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
-import configparser
+import functools
+import json
 import os
-import sys
-from typing import List
+import re
+import types
+import zlib
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# configparser, tomllib and sys are imported lazily in the branches that need
+# them so the common INI path (and cached reloads) never pay for them.
 
 DEFAULT_CONFIG = '''# config.ini
 # Generated automatically on first run. Edit and set your Lidarr API key.
@@ -49,6 +55,9 @@ release_groups_csv_path = ./mbid-releasegroups.csv
 # SQLite database path (used when storage_type = sqlite)
 db_path = ./mbid_cache.db
 
+# Days of raw canary/CF cache responses to keep in SQLite; 0 keeps them forever (reports use daily rollups)
+response_retention_days = 0
+
 [run]
 # Processing control - enable/disable each phase
 process_release_groups = false
@@ -92,58 +101,322 @@ log_level = INFO
 '''
 
 
+# Parsed configs keyed by path, invalidated when the file's mtime or size changes
+_CFG_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any], List[str]]] = {}
+
+# Flat "[section]" headers and "key = value" / "key: value" lines are all the
+# config needs. Each line is classified by one regex: blank or comment (whole
+# lines starting with # or ;, as in configparser), section header, key/value, or
+# anything else. Anything else (indented or continuation lines, keys without a
+# delimiter, junk after a header) plus duplicate sections/keys, keys outside a
+# section and a [DEFAULT] section make the fast path hand the file to
+# configparser, so both readers always agree.
+_INI_LINE_RE = re.compile(
+    r'^(?:[ \t]*(?:[#;].*)?'                                 # blank or comment
+    r'|\[([^\]\n]+)\][ \t]*'                               # [section]
+    r'|([^\s\[#;=:][^=:\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*'  # key = value, key: value
+    r'|(.+))\r?$', re.M)
+
+# INI values that can be written to TOML unquoted
+_TOML_BARE_RE = re.compile(r'^(true|false|-?\d+(\.\d+)?)$')
+
+
+def parse_ini_text(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Parse flat INI text into {section: {key: value}} (keys lowercased), or None if configparser is needed"""
+    sections: Dict[str, Dict[str, str]] = {}
+    items = None
+    for header, key, value, other in _INI_LINE_RE.findall(text):
+        if header:
+            if header in sections or header == "DEFAULT":
+                return None
+            items = sections[header] = {}
+        elif key:
+            key = key.lower()
+            if items is None or key in items:
+                return None
+            items[key] = value
+        elif other:
+            return None
+    return sections
+
+
+def _parse_with_configparser(text: str) -> Dict[str, Dict[str, str]]:
+    """Fallback parser for files the regex parser could not make sense of"""
+    import configparser
+    cp = configparser.ConfigParser(interpolation=None)
+    cp.read_string(text)
+    return {section: dict(cp.items(section)) for section in cp.sections()}
+
+
+def ini_to_toml(text: str) -> str:
+    """Convert flat INI text to TOML line by line, keeping comments and layout"""
+    lines = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith(";"):
+            line = line.replace(";", "#", 1)
+        elif stripped and not stripped.startswith(("#", "[")) and ("=" in stripped or ":" in stripped):
+            # Split on the first delimiter, as the INI readers do
+            split_at = min(i for i in (stripped.find("="), stripped.find(":")) if i >= 0)
+            key, value = stripped[:split_at], stripped[split_at + 1:].strip()
+            if _TOML_BARE_RE.match(value.lower()):
+                value = value.lower()
+            else:
+                value = '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+            line = f"{key.rstrip()} = {value}"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def default_config_text(path: str) -> str:
+    """Return the default config contents in the format implied by path's extension"""
+    if path.endswith(".toml"):
+        return ini_to_toml(DEFAULT_CONFIG.replace("# config.ini", "# config.toml", 1))
+    return DEFAULT_CONFIG
+
+
+def migrate_legacy_ini(path: str) -> bool:
+    """Create a missing config.toml from a sibling config.ini (one-time migration)"""
+    if not path.endswith(".toml") or os.path.exists(path):
+        return False
+    legacy_ini = path[:-len(".toml")] + ".ini"
+    if not os.path.exists(legacy_ini):
+        return False
+    with open(legacy_ini, "r", encoding="utf-8") as f:
+        toml_text = ini_to_toml(f.read())
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(toml_text)
+    import sys
+    print(f"Converted {legacy_ini} to {path}", file=sys.stderr)
+    return True
+
+
+def _import_tomllib():
+    """Return tomllib (Python 3.11+) or the tomli backport, or None if neither is installed"""
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    return tomllib
+
+
+def parse_config_bytes(path: str, data: bytes) -> Dict[str, Dict[str, Any]]:
+    """Parse raw INI or TOML (chosen by path's extension) into {section: {key: value}}"""
+    text = data.decode("utf-8")
+    if path.endswith(".toml"):
+        # TOML values keep their native int/float/bool types
+        tomllib = _import_tomllib()
+        if tomllib is None:
+            raise RuntimeError(f"TOML config {path} requires Python 3.11+ or: pip install tomli")
+        return {section: table for section, table in tomllib.loads(text).items() if isinstance(table, dict)}
+    sections = parse_ini_text(text)
+    if sections is None:
+        sections = _parse_with_configparser(text)
+    return sections
+
+
+def read_config_sections(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read an INI or TOML config file into a nested {section: {key: value}} dict"""
+    with open(path, "rb") as f:
+        return parse_config_bytes(path, f.read())
+
+
+def _open_config(path: str):
+    """Open path (or path + .ini/.toml) for reading; returns (resolved_path, file or None)"""
+    for candidate in (path, path + ".ini", path + ".toml"):
+        try:
+            return candidate, open(candidate, "rb")
+        except FileNotFoundError:
+            continue
+    return path, None
+
+
+def _bootstrap_default(path: str) -> None:
+    """Write the default config to path and exit so the user can add their API key"""
+    import sys
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(default_config_text(path))
+    print(f"Created default config at {path}. Please edit api_key before running again.", file=sys.stderr)
+    sys.exit(1)
+
+
+_TRUE_LITERALS = frozenset(("1", "true", "yes", "on", "y", "t"))
+
+
+@functools.lru_cache(maxsize=32)
 def parse_bool(s: str, default: bool = False) -> bool:
-    """Parse string to boolean with fallback default"""
+    """Parse string (or native TOML bool) to boolean with fallback default"""
     if s is None:
         return default
-    return s.strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(s, bool):
+        return s
+    return str(s).strip().lower() in _TRUE_LITERALS
 
 
-def validate_config(cfg: dict) -> List[str]:
-    """Return list of configuration issues"""
-    issues = []
-    
-    # Check required fields
-    if not cfg.get("api_key") or "REPLACE_WITH_YOUR" in cfg["api_key"]:
-        issues.append("Missing or placeholder Lidarr API key")
-    
-    # Validate URLs
-    for url_key in ["lidarr_url", "target_base_url"]:
-        if not cfg.get(url_key, "").startswith(("http://", "https://")):
-            issues.append(f"Invalid URL format for {url_key}")
-    
-    # Check numeric ranges
-    if cfg.get("timeout_seconds", 0) < 1:
-        issues.append("timeout_seconds must be >= 1")
-    
-    if cfg.get("lidarr_timeout", 0) < 1:
-        issues.append("lidarr_timeout must be >= 1")
-    
-    if cfg.get("rate_limit_per_second", 0) <= 0:
-        issues.append("rate_limit_per_second must be > 0")
-    
-    if cfg.get("max_concurrent_requests", 0) < 1:
-        issues.append("max_concurrent_requests must be >= 1")
-        
-    return issues
+# (section, key) in the config file -> (normalized setting, cast, typed default)
+_KEY_MAP: List[Tuple[str, str, str, Callable[[Any], Any], Any]] = [
+    # Core settings
+    ("lidarr", "base_url", "lidarr_url", str, "http://192.168.1.103:8686"),
+    ("lidarr", "api_key", "api_key", str, ""),
+    ("lidarr", "verify_ssl", "verify_ssl", parse_bool, True),
+    ("lidarr", "lidarr_timeout", "lidarr_timeout", int, 60),
+    ("probe", "target_base_url", "target_base_url", str, "https://api.lidarr.audio/api/v0.4"),
+    ("probe", "timeout_seconds", "timeout_seconds", int, 10),
+
+    # Storage settings (paths are resolved relative to the config file)
+    ("ledger", "storage_type", "storage_type", str, "csv"),
+    ("ledger", "artists_csv_path", "artists_csv_path", str, "mbid-artists.csv"),
+    ("ledger", "release_groups_csv_path", "release_groups_csv_path", str, "mbid-releasegroups.csv"),
+    ("ledger", "db_path", "db_path", str, "mbid_cache.db"),
+    ("ledger", "response_retention_days", "response_retention_days", int, 0),
+
+    # Processing control
+    ("run", "process_release_groups", "process_release_groups", parse_bool, False),
+    ("run", "process_artist_textsearch", "process_artist_textsearch", parse_bool, True),
+    ("run", "process_manual_entries", "process_manual_entries", parse_bool, False),
+    ("run", "force_artists", "force_artists", parse_bool, False),
+    ("run", "force_rg", "force_rg", parse_bool, False),
+    ("run", "force_text_search", "force_text_search", parse_bool, False),
+    ("actions", "update_lidarr", "update_lidarr", parse_bool, False),
+
+    # Text search processing options
+    ("run", "artist_textsearch_lowercase", "artist_textsearch_lowercase", parse_bool, True),
+    ("run", "artist_textsearch_transliterate_unicode", "artist_textsearch_transliterate_unicode", parse_bool, True),
+    ("run", "artist_textsearch_remove_symbols", "artist_textsearch_remove_symbols", parse_bool, False),
+
+    # Manual entries
+    ("manual", "manual_entries_file", "manual_entries_file", str, "manual_entries.yml"),
 
+    # Shared API settings
+    ("probe", "delay_between_attempts", "delay_between_attempts", float, 0.25),
+    ("probe", "max_concurrent_requests", "max_concurrent_requests", int, 10),
+    ("probe", "rate_limit_per_second", "rate_limit_per_second", float, 5.0),
 
-def load_config(path: str) -> dict:
-    """Load INI config and return a normalized dict of settings with defaults."""
-    if not os.path.exists(path) and os.path.exists(path + ".ini"):
-        path = path + ".ini"
+    # Per-entity cache warming settings
+    ("probe", "max_attempts_per_artist", "max_attempts_per_artist", int, 25),
+    ("probe", "max_attempts_per_artist_textsearch", "max_attempts_per_artist_textsearch", int, 25),
+    ("probe", "max_attempts_per_rg", "max_attempts_per_rg", int, 15),
 
-    if not os.path.exists(path):
-        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(DEFAULT_CONFIG)
-        print(f"Created default config at {path}. Please edit api_key before running again.", file=sys.stderr)
-        sys.exit(1)
+    # Circuit breaker settings
+    ("probe", "circuit_breaker_threshold", "circuit_breaker_threshold", int, 50),
+    ("probe", "backoff_factor", "backoff_factor", float, 0.5),
+    ("probe", "max_backoff_seconds", "max_backoff_seconds", float, 15.0),
 
-    cp = configparser.ConfigParser()
-    if not cp.read(path, encoding="utf-8"):
-        raise FileNotFoundError(f"Config file not found or unreadable: {path}")
+    # Processing options
+    ("run", "batch_size", "batch_size", int, 25),
+    ("run", "batch_write_frequency", "batch_write_frequency", int, 5),
 
+    # Cache freshness settings
+    ("run", "cache_recheck_hours", "cache_recheck_hours", int, 72),
+
+    # Output formatting settings
+    ("run", "colored_output", "colored_output", parse_bool, True),
+
+    # Monitoring options
+    ("monitoring", "log_progress_every_n", "log_progress_every_n", int, 25),
+    ("monitoring", "log_level", "log_level", str, "INFO"),
+]
+
+# Typed defaults for every normalized setting, frozen at import time
+_DEFAULTS = types.MappingProxyType({out: default for _, _, out, _, default in _KEY_MAP})
+
+_PATH_KEYS = ("artists_csv_path", "release_groups_csv_path", "db_path", "manual_entries_file")
+
+
+_URL_PREFIXES = ("http://", "https://")
+_PLACEHOLDER_API_KEY = "REPLACE_WITH_YOUR_LIDARR_API_KEY"
+
+
+def _is_placeholder_key(api_key: str) -> bool:
+    """True when the API key is empty or still the generated placeholder"""
+    return not api_key or _PLACEHOLDER_API_KEY in api_key
+
+
+def _is_url(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(_URL_PREFIXES)
+
+
+# setting -> (predicate that must hold, issue reported when it does not), in
+# _KEY_MAP order. Checked while cfg is built so no second pass is needed.
+_VALIDATORS = {
+    "lidarr_url": (_is_url, "Invalid URL format for lidarr_url"),
+    "api_key": (lambda v: not _is_placeholder_key(v), "Missing or placeholder Lidarr API key"),
+    "lidarr_timeout": (lambda v: (v or 0) >= 1, "lidarr_timeout must be >= 1"),
+    "target_base_url": (_is_url, "Invalid URL format for target_base_url"),
+    "timeout_seconds": (lambda v: (v or 0) >= 1, "timeout_seconds must be >= 1"),
+    "max_concurrent_requests": (lambda v: (v or 0) >= 1, "max_concurrent_requests must be >= 1"),
+    "rate_limit_per_second": (lambda v: (v or 0) > 0, "rate_limit_per_second must be > 0"),
+}
+
+
+def validate_config(cfg: Mapping[str, Any]) -> List[str]:
+    """Return list of configuration issues for an already-built settings mapping"""
+    return [message for key, (is_valid, message) in _VALIDATORS.items() if not is_valid(cfg.get(key))]
+
+
+# Stamp stored in the sidecar; it changes whenever a setting, cast or default in
+# _KEY_MAP does. Bump _SIDECAR_VERSION when a validator or path rule changes.
+_SIDECAR_VERSION = 1
+_SIDECAR_STAMP = "%d:%08x" % (_SIDECAR_VERSION, zlib.crc32(repr(
+    [(section, key, out, cast.__name__, default) for section, key, out, cast, default in _KEY_MAP]
+    + [_PATH_KEYS, sorted(_VALIDATORS)]).encode()))
+
+
+def _sidecar_path(path: str) -> str:
+    return path + ".parsed.json"
+
+
+def _read_api_key(path: str, data: bytes) -> str:
+    """Re-read [lidarr].api_key from the config file; the sidecar never stores it"""
+    section = parse_config_bytes(path, data).get("lidarr", {})
+    return str(section["api_key"]) if "api_key" in section else ""
+
+
+def _read_sidecar(path: str, st: os.stat_result, data: bytes) -> Optional[Tuple[dict, List[str]]]:
+    """Return (cfg, issues) stored in path's JSON sidecar if it still matches the config file"""
+    try:
+        with open(_sidecar_path(path), "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    cfg = cached.get("cfg") if isinstance(cached, dict) else None
+    issues = cached.get("issues") if isinstance(cached, dict) else None
+    if (not isinstance(cfg, dict)
+            or not isinstance(issues, list)
+            or cached.get("stamp") != _SIDECAR_STAMP
+            or cached.get("mtime_ns") != st.st_mtime_ns
+            or cached.get("size") != st.st_size
+            or cached.get("path") != os.path.abspath(path)
+            or cfg.keys() != _DEFAULTS.keys() - {"api_key"}):
+        return None
+    cfg["api_key"] = _read_api_key(path, data)
+    import sys
+    return {sys.intern(key): cfg[key] for key in _DEFAULTS}, issues
+
+
+def _write_sidecar(path: str, st: os.stat_result, cfg: dict, issues: List[str]) -> None:
+    """Atomically persist cfg (minus the API key) next to the config file; read-only filesystems are ignored"""
+    sidecar = _sidecar_path(path)
+    tmp_path = sidecar + ".tmp"
+    payload = {"stamp": _SIDECAR_STAMP, "path": os.path.abspath(path), "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+               "cfg": {key: value for key, value in cfg.items() if key != "api_key"}, "issues": issues}
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _build_config(path: str, d: Dict[str, Dict[str, Any]]) -> Tuple[dict, List[str]]:
+    """Normalize parsed {section: {key: value}} data into (settings dict, validation issues)"""
     # Use config file's directory as base for relative paths
     config_dir = os.path.dirname(os.path.abspath(path))
     
@@ -157,82 +430,67 @@ def load_config(path: str) -> dict:
             path_value = path_value[2:]
         return os.path.join(config_dir, path_value)
 
-    # Load configuration with corrected path resolution
-    cfg = {
-        # Core settings
-        "lidarr_url": cp.get("lidarr", "base_url", fallback="http://192.168.1.103:8686"),
-        "api_key": cp.get("lidarr", "api_key", fallback=""),
-        "verify_ssl": parse_bool(cp.get("lidarr", "verify_ssl", fallback="true")),
-        "lidarr_timeout": cp.getint("lidarr", "lidarr_timeout", fallback=60),
-        "target_base_url": cp.get("probe", "target_base_url", fallback="https://api.lidarr.audio/api/v0.4"),
-        "timeout_seconds": cp.getint("probe", "timeout_seconds", fallback=10),
-        
-        # Storage settings with path resolution
-        "storage_type": cp.get("ledger", "storage_type", fallback="csv"),
-        "artists_csv_path": resolve_path(
-            cp.get("ledger", "artists_csv_path", fallback=""),
-            "mbid-artists.csv"  # Changed from ./data/mbid-artists.csv
-        ),
-        "release_groups_csv_path": resolve_path(
-            cp.get("ledger", "release_groups_csv_path", fallback=""),
-            "mbid-releasegroups.csv"  # Changed from ./data/mbid-releasegroups.csv
-        ),
-        "db_path": resolve_path(
-            cp.get("ledger", "db_path", fallback=""),
-            "mbid_cache.db"  # Changed from ./data/mbid_cache.db
-        ),
-        
-        # Processing control
-        "process_release_groups": parse_bool(cp.get("run", "process_release_groups", fallback="false")),
-        "process_artist_textsearch": parse_bool(cp.get("run", "process_artist_textsearch", fallback="true")),
-        "process_manual_entries": parse_bool(cp.get("run", "process_manual_entries", fallback="false")),
-        "force_artists": parse_bool(cp.get("run", "force_artists", fallback="false")),
-        "force_rg": parse_bool(cp.get("run", "force_rg", fallback="false")),
-        "force_text_search": parse_bool(cp.get("run", "force_text_search", fallback="false")),
-        "update_lidarr": parse_bool(cp.get("actions", "update_lidarr", fallback="false")),
-        
-        # Text search processing options
-        "artist_textsearch_lowercase": parse_bool(cp.get("run", "artist_textsearch_lowercase", fallback="true")),
-        "artist_textsearch_transliterate_unicode": parse_bool(cp.get("run", "artist_textsearch_transliterate_unicode", fallback="true")),
-        "artist_textsearch_remove_symbols": parse_bool(cp.get("run", "artist_textsearch_remove_symbols", fallback="false")),
-        
-        # Manual entries with path resolution
-        "manual_entries_file": resolve_path(
-            cp.get("manual", "manual_entries_file", fallback=""),
-            "manual_entries.yml"
-        ),
-        
-        # Shared API settings
-        "delay_between_attempts": cp.getfloat("probe", "delay_between_attempts", fallback=0.25),
-        "max_concurrent_requests": cp.getint("probe", "max_concurrent_requests", fallback=10),
-        "rate_limit_per_second": cp.getfloat("probe", "rate_limit_per_second", fallback=5),
-        
-        # Per-entity cache warming settings
-        "max_attempts_per_artist": cp.getint("probe", "max_attempts_per_artist", fallback=25),
-        "max_attempts_per_artist_textsearch": cp.getint("probe", "max_attempts_per_artist_textsearch", fallback=25),
-        "max_attempts_per_rg": cp.getint("probe", "max_attempts_per_rg", fallback=15),
-        
-        # Circuit breaker settings
-        "circuit_breaker_threshold": cp.getint("probe", "circuit_breaker_threshold", fallback=50),
-        "backoff_factor": cp.getfloat("probe", "backoff_factor", fallback=0.5),
-        "max_backoff_seconds": cp.getfloat("probe", "max_backoff_seconds", fallback=15),
-        
-        # Processing options
-        "batch_size": cp.getint("run", "batch_size", fallback=25),
-        "batch_write_frequency": cp.getint("run", "batch_write_frequency", fallback=5),
-        
-        # Cache freshness settings
-        "cache_recheck_hours": cp.getint("run", "cache_recheck_hours", fallback=72),
-        
-        # Output formatting settings
-        "colored_output": parse_bool(cp.get("run", "colored_output", fallback="true")),
-        
-        # Monitoring options
-        "log_progress_every_n": cp.getint("monitoring", "log_progress_every_n", fallback=25),
-        "log_level": cp.get("monitoring", "log_level", fallback="INFO"),
-    }
-
-    if not cfg["api_key"] or "REPLACE_WITH_YOUR_LIDARR_API_KEY" in cfg["api_key"]:
-        raise ValueError("Missing [lidarr].api_key in config (or still using the placeholder).")
-
-    return cfg
+    # Cast values present in the file (missing ones keep their typed default)
+    # and validate each one as it is materialized
+    cfg = {}
+    issues = []
+    for section, key, out, cast, default in _KEY_MAP:
+        value = cast(d[section][key]) if key in d.get(section, ()) else default
+        cfg[out] = value
+        rule = _VALIDATORS.get(out)
+        if rule is not None and not rule[0](value):
+            issues.append(rule[1])
+
+    # Storage and manual entry paths are resolved against the config directory
+    for key in _PATH_KEYS:
+        cfg[key] = resolve_path(cfg[key], _DEFAULTS[key])
+
+    return cfg, issues
+
+
+def load_config_with_issues(path: str) -> Tuple[Mapping[str, Any], List[str]]:
+    """Load INI or TOML config; returns (read-only settings mapping, validation issues).
+
+    The returned mapping is shared between callers; copy it with dict() when
+    settings need to be overridden in place. Parsed settings are also
+    persisted to a "<config>.parsed.json" sidecar so fresh processes can skip
+    casting, validating and resolving paths while the config file is unchanged.
+    The API key is left out of the sidecar and read from the config file.
+    """
+    path, fh = _open_config(path)
+    if fh is None:
+        if not migrate_legacy_ini(path):
+            _bootstrap_default(path)
+        fh = open(path, "rb")
+
+    with fh:
+        st = os.fstat(fh.fileno())
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cached = _CFG_CACHE.get(path)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], list(cached[2])
+        data = fh.read()
+        from_sidecar = _read_sidecar(path, st, data)
+
+    if from_sidecar is not None:
+        cfg, issues = from_sidecar
+    else:
+        cfg, issues = _build_config(path, parse_config_bytes(path, data))
+        if _is_placeholder_key(cfg["api_key"]):
+            raise ValueError("Missing [lidarr].api_key in config (or still using the placeholder).")
+        _write_sidecar(path, st, cfg, issues)
+
+    frozen = types.MappingProxyType(cfg)
+    _CFG_CACHE[path] = (cache_key, frozen, issues)
+    return frozen, list(issues)
+
+
+def load_config(path: str) -> Mapping[str, Any]:
+    """Load INI or TOML config and return a read-only mapping of settings with defaults."""
+    return load_config_with_issues(path)[0]
+
+
+def load_config_mutable(path: str) -> Tuple[dict, List[str]]:
+    """Load config as a private (dict, issues) pair for callers that override settings in place."""
+    cfg, issues = load_config_with_issues(path)
+    return dict(cfg), issues
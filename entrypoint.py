@@ -1,5 +1,4 @@
 #!/usr/bin/env python3
-import configparser
 import os
 import signal
 import subprocess
@@ -7,7 +6,7 @@ import sys
 import time
 from datetime import datetime
 
-from config import DEFAULT_CONFIG
+from config import default_config_text, migrate_legacy_ini, parse_bool, read_config_sections
 from colors import Colors
 
 
@@ -19,11 +18,6 @@ def _sig_handler(signum, frame):
     shutdown_msg = Colors.warning(f"Received signal {signum}. Shutting down after current run...", True)
     print(f"[{datetime.now().isoformat()}] {shutdown_msg}", flush=True)
 
-def parse_bool(s: str, default: bool = False) -> bool:
-    if s is None:
-        return default
-    return s.strip().lower() in ("1", "true", "yes", "on")
-
 def main():
     # Resolve CONFIG_PATH and normalize to absolute early
     raw_cfg = os.environ.get("CONFIG_PATH", "/app/data/config.ini")
@@ -31,25 +25,27 @@ def main():
 
     # If config is missing, create and exit so the user can fill it in
     cfg_dir = os.path.dirname(config_path) or "."
+    migrate_legacy_ini(config_path)
     if not os.path.exists(config_path):
         os.makedirs(cfg_dir, exist_ok=True)
         with open(config_path, "w", encoding="utf-8") as f:
-            f.write(DEFAULT_CONFIG)
+            f.write(default_config_text(config_path))
         config_created_msg = Colors.info(f"Created default config at {config_path}. Please edit api_key and restart.", True)
         print(f"[{datetime.now().isoformat()}] {config_created_msg}", flush=True)
         sys.exit(1)
 
-    # Load schedule settings
-    cp = configparser.ConfigParser()
-    if not cp.read(config_path, encoding="utf-8"):
-        error_msg = Colors.error(f"Could not read config: {config_path}", True)
+    # Load schedule settings (INI or TOML)
+    try:
+        schedule = read_config_sections(config_path).get("schedule", {})
+    except Exception as e:
+        error_msg = Colors.error(f"Could not read config: {config_path} ({e})", True)
         print(f"ERROR: {error_msg}", file=sys.stderr)
         sys.exit(2)
 
-    interval_seconds = cp.getint("schedule", "interval_seconds", fallback=3600)
-    run_at_start     = parse_bool(cp.get("schedule", "run_at_start", fallback="true"))
-    jitter_seconds   = cp.getint("schedule", "jitter_seconds", fallback=0)  # optional, default 0
-    max_runs         = cp.getint("schedule", "max_runs", fallback=50)        # updated default
+    interval_seconds = int(schedule.get("interval_seconds", 3600))
+    run_at_start     = parse_bool(schedule.get("run_at_start", "true"))
+    jitter_seconds   = int(schedule.get("jitter_seconds", 0))  # optional, default 0
+    max_runs         = int(schedule.get("max_runs", 50))        # updated default
 
     if interval_seconds < 1:
         error_msg = Colors.error("[schedule].interval_seconds must be >= 1", True)
@@ -10,7 +10,7 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 import requests
-from config import load_config, validate_config
+from config import load_config_mutable
 from storage import create_storage_backend, iso_now
 from process_manual_entries import process_manual_entries
 from colors import Colors
@@ -272,7 +272,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        cfg = load_config(args.config)
+        cfg, config_issues = load_config_mutable(args.config)  # first-run and CLI force modes are applied in place below
     except Exception as e:
         print(f"ERROR loading config: {e}", file=sys.stderr)
         sys.exit(2)
@@ -323,8 +323,7 @@ def main():
         cfg["max_attempts_per_rg"] = 1
         print("Force release groups mode enabled from config: max_attempts_per_rg set to 1 for quick refresh.")
 
-    # Validate configuration
-    config_issues = validate_config(cfg)
+    # Report configuration issues found while loading
     if config_issues:
         print("Configuration issues found:", file=sys.stderr)
         for issue in config_issues:
@@ -679,6 +678,15 @@ def main():
         print("Release group processing disabled in config")
         rg_results = {"transitioned": 0, "new_successes": 0, "new_failures": 0}
 
+    # Make sure queued response analytics hit the database before reporting
+    storage.flush()
+    if hasattr(storage, 'prune_responses'):
+        pruned = storage.prune_responses()
+        if pruned:
+            print(f"🧹 Pruned {pruned:,} response analytics rows older than {cfg.get('response_retention_days', 0)} days")
+    if hasattr(storage, 'analyze_if_needed'):
+        storage.analyze_if_needed()
+    
     # Final summary
     print(f"\n=== Final Summary ===")
     print(f"Artist MBID Warming: {artist_results}")
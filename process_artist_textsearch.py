@@ -336,6 +336,7 @@ async def check_text_searches_concurrent_with_timing(
     batch_attempts = 0
     
     async with aiohttp.ClientSession(timeout=timeout_obj) as session:
+        dirty = []  # Keys updated since the last batch write
         for i, mbid in enumerate(to_check):
             # Check circuit breaker
             if not await rate_limiter.acquire():
@@ -465,9 +466,11 @@ async def check_text_searches_concurrent_with_timing(
                 timeout_text = Colors.error("TIMEOUT", colored_output)
                 print(f" {timeout_text} (code=EXC:{type(e).__name__}, attempts={cfg['max_attempts_per_artist_textsearch']})")
             
-            # Batch writing
+            # Batch writing (only the rows touched since the last write)
+            dirty.append(mbid)
             if global_position % cfg.get("batch_write_frequency", 5) == 0:
-                storage.write_artists_ledger(ledger)
+                storage.write_artists_rows(ledger, dirty)
+                dirty.clear()
             
             # Progress reporting with batch stats
             if global_position % cfg.get("log_progress_every_n", 25) == 0:
@@ -536,7 +539,7 @@ def process_text_searches_in_batches(
         total_processed += len(batch)
         
         # Write after each batch
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, batch)
         complete_text = Colors.success(f"Text search batch {batch_num} complete. Ledger updated.", colored_output)
         print(complete_text)
         
@@ -605,7 +608,7 @@ def process_text_search(to_check: List[str], ledger: Dict[str, Dict], cfg: dict,
             )
             
         # Final write
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         
         failures = attempts - successes
         
@@ -617,10 +620,10 @@ def process_text_search(to_check: List[str], ledger: Dict[str, Dict], cfg: dict,
     except KeyboardInterrupt:
         warning_text = Colors.warning("⚠️  Interrupted by user. Saving progress...", colored_output)
         print(f"\n{warning_text}")
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         return {"new_successes": 0, "new_failures": 0}
     except Exception as e:
         error_text = Colors.error(f"ERROR in text search processing: {e}", colored_output)
         print(error_text)
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         raise
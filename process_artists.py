@@ -261,6 +261,7 @@ async def check_artists_concurrent_with_timing(
     batch_timeouts = 0
     
     async with aiohttp.ClientSession(timeout=timeout_obj) as session:
+        dirty = []  # Keys updated since the last batch write
         for i, mbid in enumerate(to_check):
             # Check circuit breaker
             if not await rate_limiter.acquire():
@@ -387,9 +388,11 @@ async def check_artists_concurrent_with_timing(
                 timeout_text = Colors.error("TIMEOUT", colored_output)
                 print(f" {timeout_text} (code=EXC:{type(e).__name__}, attempts={cfg['max_attempts_per_artist']})")
             
-            # Batch writing
+            # Batch writing (only the rows touched since the last write)
+            dirty.append(mbid)
             if global_position % cfg.get("batch_write_frequency", 5) == 0:
-                storage.write_artists_ledger(ledger)
+                storage.write_artists_rows(ledger, dirty)
+                dirty.clear()
             
             # Progress reporting with batch stats - FIX: Count WITHIN this batch only
             if global_position % cfg.get("log_progress_every_n", 25) == 0:
@@ -467,7 +470,7 @@ def process_artists_in_batches(
         total_processed += len(batch)
         
         # Write after each batch
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, batch)
         complete_text = Colors.success(f"Artists batch {batch_num} complete. Ledger updated.", colored_output)
         print(complete_text)
         
@@ -503,7 +506,7 @@ def process_artists(to_check: List[str], ledger: Dict[str, Dict], cfg: dict, sto
             )
             
         # Final write
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         
         return {
             "transitioned": transitioned,
@@ -514,10 +517,10 @@ def process_artists(to_check: List[str], ledger: Dict[str, Dict], cfg: dict, sto
     except KeyboardInterrupt:
         warning_text = Colors.warning("⚠️  Interrupted by user. Saving progress...", colored_output)
         print(f"\n{warning_text}")
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         return {"transitioned": 0, "new_successes": 0, "new_failures": 0}
     except Exception as e:
         error_text = Colors.error(f"ERROR in artist processing: {e}", colored_output)
         print(error_text)
-        storage.write_artists_ledger(ledger)
+        storage.write_artists_rows(ledger, to_check)
         raise
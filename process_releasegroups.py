@@ -232,6 +232,7 @@ async def check_release_groups_concurrent_with_timing(
     batch_timeouts = 0
     
     async with aiohttp.ClientSession(timeout=timeout_obj) as session:
+        dirty = []  # Keys updated since the last batch write
         for i, rg_mbid in enumerate(to_check):
             # Check circuit breaker
             if not await rate_limiter.acquire():
@@ -353,9 +354,11 @@ async def check_release_groups_concurrent_with_timing(
                 timeout_text = Colors.error("TIMEOUT", colored_output)
                 print(f" {timeout_text} (code=EXC:{type(e).__name__}, attempts={cfg['max_attempts_per_rg']})")
             
-            # Batch writing
+            # Batch writing (only the rows touched since the last write)
+            dirty.append(rg_mbid)
             if global_position % cfg.get("batch_write_frequency", 5) == 0:
-                storage.write_release_groups_ledger(ledger)
+                storage.write_release_groups_rows(ledger, dirty)
+                dirty.clear()
             
             # Progress reporting with batch stats
             if global_position % cfg.get("log_progress_every_n", 25) == 0:
@@ -427,7 +430,7 @@ def process_release_groups_in_batches(
         total_processed += len(batch)
         
         # Write after each batch
-        storage.write_release_groups_ledger(ledger)
+        storage.write_release_groups_rows(ledger, batch)
         complete_text = Colors.success(f"Release groups batch {batch_num} complete. Ledger updated.", colored_output)
         print(complete_text)
         
@@ -463,7 +466,7 @@ def process_release_groups(to_check: List[str], ledger: Dict[str, Dict], cfg: di
             )
             
         # Final write
-        storage.write_release_groups_ledger(ledger)
+        storage.write_release_groups_rows(ledger, to_check)
         
         return {
             "transitioned": transitioned,
@@ -474,10 +477,10 @@ def process_release_groups(to_check: List[str], ledger: Dict[str, Dict], cfg: di
     except KeyboardInterrupt:
         warning_text = Colors.warning("⚠️  Interrupted by user. Saving progress...", colored_output)
         print(f"\n{warning_text}")
-        storage.write_release_groups_ledger(ledger)
+        storage.write_release_groups_rows(ledger, to_check)
         return {"transitioned": 0, "new_successes": 0, "new_failures": 0}
     except Exception as e:
         error_text = Colors.error(f"ERROR in release group processing: {e}", colored_output)
         print(error_text)
-        storage.write_release_groups_ledger(ledger)
+        storage.write_release_groups_rows(ledger, to_check)
         raise
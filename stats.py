@@ -1,61 +1,218 @@
 #!/usr/bin/env python3
 import argparse
+import collections
+import contextlib
+import functools
+import io
+import json
 import os
-import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict
+from math import inf
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
 
-from config import load_config, validate_config
+from config import load_config_with_issues
 from main import get_lidarr_artists, get_lidarr_release_groups
-from storage import create_storage_backend
+from storage import create_storage_backend, storage_exists
 
+# Import numpy with fallback (only used to vectorize staleness on large ledgers)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-def is_stale(last_checked: str, recheck_hours: int) -> bool:
-    """Check if a cache entry is stale based on last_checked timestamp and recheck hours"""
-    if recheck_hours <= 0:
-        return False  # Recheck disabled
-    
-    if not last_checked:
-        return True  # Never checked = stale
-    
+# Import numba with fallback (JIT-compiles the staleness kernel when present)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many rows the per-row loop is faster than building arrays
+NUMPY_MIN_ROWS = 5000
+NUMPY_MIN_OUTCOMES = 32  # Same trade-off for one cross-tab block's percentages
+
+# Import ciso8601 with fallback (C ISO-8601 parser, handles 'Z' natively)
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Import unidecode with fallback (only reported in the Unicode support banner)
+try:
+    import unidecode
+    UNIDECODE_AVAILABLE = True
+except ImportError:
+    UNIDECODE_AVAILABLE = False
+
+_UTC = timezone.utc
+
+
+@contextlib.contextmanager
+def _buffered_output():
+    """Collect print() output in memory and emit it with a single write"""
+    stdout = sys.stdout
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        stdout.write(buf.getvalue())
+        stdout.flush()
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_ts(timestamp: str) -> Optional[float]:
+    """Parse an ISO timestamp into POSIX seconds (None if invalid)"""
     try:
+        if CISO8601_AVAILABLE:
+            parsed = ciso8601.parse_datetime(timestamp)
+            if parsed.tzinfo is None:
+                if 'T' not in timestamp:
+                    return None  # Date-only values are treated as invalid
+                parsed = parsed.replace(tzinfo=_UTC)  # Naive = UTC
+            return parsed.timestamp()
+        
         # Parse ISO timestamp (handles both with/without timezone)
-        if last_checked.endswith('Z'):
-            last_checked = last_checked[:-1] + '+00:00'
-        elif '+' not in last_checked and 'T' in last_checked:
-            last_checked += '+00:00'
+        if timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        elif '+' not in timestamp and 'T' in timestamp:
+            timestamp += '+00:00'
         
-        last_time = datetime.fromisoformat(last_checked)
-        now = datetime.now(timezone.utc)
-        hours_since = (now - last_time).total_seconds() / 3600
-        return hours_since >= recheck_hours
-    except Exception:
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.tzinfo is None:
+            return None  # Can't compare naive times against UTC
+        return parsed.timestamp()
+    except ValueError:
+        return None
+
+
+def _is_stale_enabled(last_checked: str, cutoff_ts: float) -> bool:
+    """Staleness check for callers that already know recheck is enabled (cutoff = now - threshold)"""
+    if not last_checked:
+        return True  # Never checked = stale
+    
+    last_ts = _parse_ts(last_checked)
+    if last_ts is None:
         return True  # Invalid timestamp = stale
+    
+    return last_ts <= cutoff_ts
 
 
-def get_hours_until_stale(last_checked: str, recheck_hours: int) -> float:
-    """Get hours until entry becomes stale. Returns 0 if already stale or never checked."""
-    if recheck_hours <= 0 or not last_checked:
+def _hours_until_stale_enabled(last_checked: str, cutoff_ts: float) -> float:
+    """Hours until stale for callers that already know recheck is enabled"""
+    if not last_checked:
         return 0
     
-    try:
-        if last_checked.endswith('Z'):
-            last_checked = last_checked[:-1] + '+00:00'
-        elif '+' not in last_checked and 'T' in last_checked:
-            last_checked += '+00:00'
-        
-        last_time = datetime.fromisoformat(last_checked)
-        now = datetime.now(timezone.utc)
-        hours_since = (now - last_time).total_seconds() / 3600
-        hours_remaining = recheck_hours - hours_since
-        return max(0, hours_remaining)
-    except Exception:
+    last_ts = _parse_ts(last_checked)
+    if last_ts is None:
+        return 0
+    
+    return max(0, (last_ts - cutoff_ts) / 3600)
+
+
+def is_stale(last_checked: str, recheck_hours: int, now_ts: Optional[float] = None) -> bool:
+    """Check if a cache entry is stale based on last_checked timestamp and recheck hours"""
+    if recheck_hours <= 0:
+        return False  # Recheck disabled
+    return _is_stale_enabled(last_checked, (time.time() if now_ts is None else now_ts) - recheck_hours * 3600)
+
+
+def get_hours_until_stale(last_checked: str, recheck_hours: int, now_ts: Optional[float] = None) -> float:
+    """Get hours until entry becomes stale. Returns 0 if already stale or never checked."""
+    if recheck_hours <= 0:
         return 0
+    return _hours_until_stale_enabled(last_checked, (time.time() if now_ts is None else now_ts) - recheck_hours * 3600)
+
+def _stale_kernel(times, success_mask, cutoff):
+    """Single pass stale count and smallest seconds-until-stale (NaN times count as stale)"""
+    stale = 0
+    next_secs = np.inf
+    for i in range(times.shape[0]):
+        t = times[i]
+        if t > cutoff:
+            if t - cutoff < next_secs:
+                next_secs = t - cutoff
+        elif success_mask[i]:
+            stale += 1
+    return stale, next_secs
+
+
+if NUMBA_AVAILABLE:
+    _stale_kernel = njit(cache=True)(_stale_kernel)
+
+
+def _staleness_numpy(timestamps: List[str], success_mask, recheck_hours: int, now_ts: float) -> Tuple[int, float]:
+    """Vectorized stale count and smallest hours-until-stale for one timestamp column"""
+    # Empty or invalid timestamps become NaN, which is never "fresh"
+    parsed = np.array([_parse_ts(ts) if ts else None for ts in timestamps], dtype=float)
+    if NUMBA_AVAILABLE:
+        stale, next_secs = _stale_kernel(parsed, success_mask, now_ts - recheck_hours * 3600)
+        return stale, next_secs / 3600
+    
+    ages = (now_ts - parsed) / 3600
+    fresh = ages < recheck_hours
+    stale = int(np.count_nonzero(success_mask & ~fresh))
+    remaining = recheck_hours - ages[fresh]
+    return stale, float(remaining.min()) if remaining.size else inf
+
+
+def _status_buckets(ledger: Dict[str, Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Return (success_rows, timeout_rows), reusing the buckets filled at ledger load time"""
+    if hasattr(ledger, "success_rows"):
+        return ledger.success_rows, ledger.timeout_rows
+    
+    success_rows = []
+    timeout_rows = []
+    for r in ledger.values():
+        status = r.get("status", "")
+        if status == "success":
+            success_rows.append(r)
+        elif status == "timeout":
+            timeout_rows.append(r)
+    return success_rows, timeout_rows
+
+
+def _artist_stats_result(total: int, success: int, timeout: int, text_search_attempted: int,
+                         text_search_success: int, artists_with_names: int, stale_mbid_cache: int,
+                         stale_text_search: int, next_recheck_hours: float, recheck_enabled: bool) -> Dict[str, any]:
+    """Build the artist stats dict from raw counters"""
+    pending = total - success - timeout
+    success_rate = (success / total * 100) if total > 0 else 0.0
+    text_search_success_rate = (text_search_success / text_search_attempted * 100) if text_search_attempted > 0 else 0.0
+    text_search_pending = artists_with_names - text_search_attempted
+    
+    return {
+        "total": total,
+        "success": success,
+        "timeout": timeout,
+        "pending": pending,
+        "success_rate": success_rate,
+        "text_search_attempted": text_search_attempted,
+        "text_search_success": text_search_success,
+        "text_search_success_rate": text_search_success_rate,
+        "text_search_pending": text_search_pending,
+        "artists_with_names": artists_with_names,
+        "stale_mbid_cache": stale_mbid_cache,
+        "stale_text_search": stale_text_search,
+        "next_recheck_hours": next_recheck_hours,
+        "recheck_enabled": recheck_enabled
+    }
 
 
-def analyze_artists_stats(artists_ledger: Dict[str, Dict], cache_recheck_hours: int) -> Dict[str, any]:
+def analyze_artists_stats(artists_ledger: Dict[str, Dict], cache_recheck_hours: int, storage=None) -> Dict[str, any]:
     """Analyze artist statistics from ledger including staleness information"""
+    # SQLite can aggregate the whole table in one query; skip the Python loop
+    if hasattr(storage, "get_artist_staleness_summary"):
+        summary = storage.get_artist_staleness_summary(cache_recheck_hours)
+        return _artist_stats_result(recheck_enabled=cache_recheck_hours > 0, **summary)
+    
     if not artists_ledger:
         return {
             "total": 0,
@@ -74,69 +231,104 @@ def analyze_artists_stats(artists_ledger: Dict[str, Dict], cache_recheck_hours:
             "recheck_enabled": cache_recheck_hours > 0
         }
     
+    recheck_enabled = cache_recheck_hours > 0
     total = len(artists_ledger)
-    success = sum(1 for r in artists_ledger.values() if r.get("status", "").lower() == "success")
-    timeout = sum(1 for r in artists_ledger.values() if r.get("status", "").lower() == "timeout")
-    pending = total - success - timeout
-    success_rate = (success / total * 100) if total > 0 else 0.0
-    
-    # Text search statistics
-    text_search_attempted = sum(1 for r in artists_ledger.values() if r.get("text_search_attempted", False))
-    text_search_success = sum(1 for r in artists_ledger.values() if r.get("text_search_success", False))
-    text_search_success_rate = (text_search_success / text_search_attempted * 100) if text_search_attempted > 0 else 0.0
-    
-    # Artists with names that could be text searched but haven't been attempted
-    artists_with_names = sum(1 for r in artists_ledger.values() if r.get("artist_name", "").strip())
-    text_search_pending = artists_with_names - text_search_attempted
-    
-    # Staleness statistics (only if recheck is enabled)
+    success_rows, timeout_rows = _status_buckets(artists_ledger)
+    success = len(success_rows)
+    timeout = len(timeout_rows)
+    text_search_attempted = 0
+    text_search_success = 0
+    artists_with_names = 0
     stale_mbid_cache = 0
     stale_text_search = 0
-    next_recheck_hours = float('inf')
+    next_recheck_hours = inf
+    now_ts = time.time()  # Same reference time for every row
+    cutoff_ts = now_ts - cache_recheck_hours * 3600  # Rows checked at or before this are stale
+    use_numpy = recheck_enabled and NUMPY_AVAILABLE and total >= NUMPY_MIN_ROWS
+    scan_staleness = recheck_enabled and not use_numpy
     
-    if cache_recheck_hours > 0:
-        for r in artists_ledger.values():
-            # Count stale MBID cache entries (successful but stale)
-            if (r.get("status", "").lower() == "success" and 
-                is_stale(r.get("last_checked", ""), cache_recheck_hours)):
-                stale_mbid_cache += 1
+    # Single pass over the ledger for everything not covered by the status buckets
+    for r in artists_ledger.values():
+        get = r.get
+        ts_success = get("text_search_success", False)
+        
+        if get("text_search_attempted", False):
+            text_search_attempted += 1
+        if ts_success:
+            text_search_success += 1
+        # Artists with names that could be text searched
+        if get("artist_name", "").strip():
+            artists_with_names += 1
+        
+        # Staleness statistics (only if recheck is enabled)
+        if scan_staleness:
+            last_checked = get("last_checked", "")
+            ts_last_checked = get("text_search_last_checked", "")
             
             # Count stale text search entries (successful but stale)
-            if (r.get("text_search_success", False) and 
-                is_stale(r.get("text_search_last_checked", ""), cache_recheck_hours)):
+            if ts_success and _is_stale_enabled(ts_last_checked, cutoff_ts):
                 stale_text_search += 1
             
             # Find next recheck time
-            for timestamp_field in ["last_checked", "text_search_last_checked"]:
-                timestamp = r.get(timestamp_field, "")
+            for timestamp in (last_checked, ts_last_checked):
                 if timestamp:
-                    hours_until_stale = get_hours_until_stale(timestamp, cache_recheck_hours)
+                    hours_until_stale = _hours_until_stale_enabled(timestamp, cutoff_ts)
                     if 0 < hours_until_stale < next_recheck_hours:
                         next_recheck_hours = hours_until_stale
     
-    if next_recheck_hours == float('inf'):
+    # Stale MBID cache entries can only be successful ones
+    if scan_staleness:
+        for r in success_rows:
+            if _is_stale_enabled(r.get("last_checked", ""), cutoff_ts):
+                stale_mbid_cache += 1
+    
+    # Large ledgers: compute staleness column-wise instead
+    if use_numpy:
+        rows = list(artists_ledger.values())
+        stale_mbid_cache, next_mbid = _staleness_numpy(
+            [r.get("last_checked", "") for r in rows],
+            np.fromiter((r.get("status", "") == "success" for r in rows), dtype=bool, count=total),
+            cache_recheck_hours, now_ts)
+        stale_text_search, next_text = _staleness_numpy(
+            [r.get("text_search_last_checked", "") for r in rows],
+            np.fromiter((bool(r.get("text_search_success", False)) for r in rows), dtype=bool, count=total),
+            cache_recheck_hours, now_ts)
+        next_recheck_hours = min(next_mbid, next_text)
+    
+    if next_recheck_hours == inf:
         next_recheck_hours = 0
     
+    return _artist_stats_result(total, success, timeout, text_search_attempted, text_search_success,
+                                artists_with_names, stale_mbid_cache, stale_text_search,
+                                next_recheck_hours, recheck_enabled)
+
+
+def _release_group_stats_result(total: int, success: int, timeout: int, eligible: int, stale_entries: int,
+                                next_recheck_hours: float, recheck_enabled: bool) -> Dict[str, any]:
+    """Build the release group stats dict from raw counters"""
+    pending = total - success - timeout
+    success_rate = (success / total * 100) if total > 0 else 0.0
+    
     return {
         "total": total,
         "success": success,
         "timeout": timeout,
         "pending": pending,
         "success_rate": success_rate,
-        "text_search_attempted": text_search_attempted,
-        "text_search_success": text_search_success,
-        "text_search_success_rate": text_search_success_rate,
-        "text_search_pending": text_search_pending,
-        "artists_with_names": artists_with_names,
-        "stale_mbid_cache": stale_mbid_cache,
-        "stale_text_search": stale_text_search,
+        "eligible_for_processing": eligible,
+        "stale_entries": stale_entries,
         "next_recheck_hours": next_recheck_hours,
-        "recheck_enabled": cache_recheck_hours > 0
+        "recheck_enabled": recheck_enabled
     }
 
 
-def analyze_release_groups_stats(rg_ledger: Dict[str, Dict], cache_recheck_hours: int) -> Dict[str, any]:
+def analyze_release_groups_stats(rg_ledger: Dict[str, Dict], cache_recheck_hours: int, storage=None) -> Dict[str, any]:
     """Analyze release group statistics from ledger including staleness information"""
+    # SQLite can aggregate the whole table in one query; skip the Python loop
+    if hasattr(storage, "get_release_group_staleness_summary"):
+        summary = storage.get_release_group_staleness_summary(cache_recheck_hours)
+        return _release_group_stats_result(recheck_enabled=cache_recheck_hours > 0, **summary)
+    
     if not rg_ledger:
         return {
             "total": 0,
@@ -150,91 +342,222 @@ def analyze_release_groups_stats(rg_ledger: Dict[str, Dict], cache_recheck_hours
             "recheck_enabled": cache_recheck_hours > 0
         }
     
+    recheck_enabled = cache_recheck_hours > 0
     total = len(rg_ledger)
-    success = sum(1 for r in rg_ledger.values() if r.get("status", "").lower() == "success")
-    timeout = sum(1 for r in rg_ledger.values() if r.get("status", "").lower() == "timeout")
-    pending = total - success - timeout
-    success_rate = (success / total * 100) if total > 0 else 0.0
-    
-    # Count RGs eligible for processing (artist successfully cached)
-    eligible = sum(1 for r in rg_ledger.values() 
-                  if r.get("artist_cache_status", "").lower() == "success")
-    
-    # Staleness statistics (only if recheck is enabled)
+    success_rows, timeout_rows = _status_buckets(rg_ledger)
+    success = len(success_rows)
+    timeout = len(timeout_rows)
+    eligible = 0
     stale_entries = 0
-    next_recheck_hours = float('inf')
+    next_recheck_hours = inf
+    now_ts = time.time()  # Same reference time for every row
+    cutoff_ts = now_ts - cache_recheck_hours * 3600  # Rows checked at or before this are stale
+    use_numpy = recheck_enabled and NUMPY_AVAILABLE and total >= NUMPY_MIN_ROWS
+    scan_staleness = recheck_enabled and not use_numpy
     
-    if cache_recheck_hours > 0:
-        for r in rg_ledger.values():
-            # Count stale entries (successful but stale)
-            if (r.get("status", "").lower() == "success" and 
-                is_stale(r.get("last_checked", ""), cache_recheck_hours)):
-                stale_entries += 1
+    # Single pass over the ledger for everything not covered by the status buckets
+    for r in rg_ledger.values():
+        get = r.get
+        
+        # Count RGs eligible for processing (artist successfully cached)
+        if get("artist_cache_status", "") == "success":
+            eligible += 1
+        
+        # Staleness statistics (only if recheck is enabled)
+        if scan_staleness:
+            timestamp = get("last_checked", "")
             
             # Find next recheck time
-            timestamp = r.get("last_checked", "")
             if timestamp:
-                hours_until_stale = get_hours_until_stale(timestamp, cache_recheck_hours)
+                hours_until_stale = _hours_until_stale_enabled(timestamp, cutoff_ts)
                 if 0 < hours_until_stale < next_recheck_hours:
                     next_recheck_hours = hours_until_stale
     
-    if next_recheck_hours == float('inf'):
+    # Stale entries can only be successful ones
+    if scan_staleness:
+        for r in success_rows:
+            if _is_stale_enabled(r.get("last_checked", ""), cutoff_ts):
+                stale_entries += 1
+    
+    # Large ledgers: compute staleness column-wise instead
+    if use_numpy:
+        rows = list(rg_ledger.values())
+        stale_entries, next_recheck_hours = _staleness_numpy(
+            [r.get("last_checked", "") for r in rows],
+            np.fromiter((r.get("status", "") == "success" for r in rows), dtype=bool, count=total),
+            cache_recheck_hours, now_ts)
+    
+    if next_recheck_hours == inf:
         next_recheck_hours = 0
     
-    return {
-        "total": total,
-        "success": success,
-        "timeout": timeout,
-        "pending": pending,
-        "success_rate": success_rate,
-        "eligible_for_processing": eligible,
-        "stale_entries": stale_entries,
-        "next_recheck_hours": next_recheck_hours,
-        "recheck_enabled": cache_recheck_hours > 0
-    }
+    return _release_group_stats_result(total, success, timeout, eligible, stale_entries,
+                                       next_recheck_hours, recheck_enabled)
+
+
+# Fallbacks for settings missing from cfg when rendering the summary
+_SUMMARY_DEFAULTS = {
+    "lidarr_timeout": 60,
+    "verify_ssl": True,
+    "max_concurrent_requests": 5,
+    "rate_limit_per_second": 3,
+    "delay_between_attempts": 0.5,
+    "max_attempts_per_artist": 25,
+    "max_attempts_per_artist_textsearch": 25,
+    "max_attempts_per_rg": 15,
+    "process_release_groups": False,
+    "process_artist_textsearch": True,
+    "batch_size": 25,
+    "cache_recheck_hours": 72,
+    "artist_textsearch_lowercase": False,
+    "artist_textsearch_transliterate_unicode": False,
+    "artist_textsearch_remove_symbols": False,
+    "storage_type": "csv",
+    "db_path": "mbid_cache.db",
+    "artists_csv_path": "mbid-artists.csv",
+    "release_groups_csv_path": "mbid-releasegroups.csv",
+}
+
+_SUMMARY_TEMPLATE = """\
+📋 Key Configuration Settings:
+   Connection & Security:
+     • lidarr_timeout: {lidarr_timeout}s
+     • verify_ssl: {verify_ssl}
+   API Rate Limiting:
+     • max_concurrent_requests: {max_concurrent_requests}
+     • rate_limit_per_second: {rate_limit_per_second}
+     • delay_between_attempts: {delay_between_attempts}s
+   Cache Warming Attempts:
+     • max_attempts_per_artist: {max_attempts_per_artist}
+     • max_attempts_per_artist_textsearch: {max_attempts_per_artist_textsearch}
+     • max_attempts_per_rg: {max_attempts_per_rg}
+   Processing Options:
+     • process_release_groups: {process_release_groups}
+     • process_artist_textsearch: {process_artist_textsearch}
+     • batch_size: {batch_size}
+     • cache_recheck_hours: {cache_recheck_hours}
+   Text Search Processing:
+     • artist_textsearch_lowercase: {artist_textsearch_lowercase}
+     • artist_textsearch_transliterate_unicode: {artist_textsearch_transliterate_unicode}
+     • artist_textsearch_remove_symbols: {artist_textsearch_remove_symbols} (deprecated)
+   Storage Backend:
+     • storage_type: {storage_type}
+"""
+
+_SQLITE_SUMMARY_TEMPLATE = _SUMMARY_TEMPLATE + """\
+     • db_path: {db_path}"""
+
+_CSV_SUMMARY_TEMPLATE = _SUMMARY_TEMPLATE + """\
+     • artists_csv_path: {artists_csv_path}
+     • release_groups_csv_path: {release_groups_csv_path}"""
 
 
 def format_config_summary(cfg: dict) -> str:
     """Format key configuration settings"""
-    storage_type = cfg.get("storage_type", "csv")
+    values = collections.ChainMap(cfg, _SUMMARY_DEFAULTS)
+    template = _SQLITE_SUMMARY_TEMPLATE if values["storage_type"] == "sqlite" else _CSV_SUMMARY_TEMPLATE
+    return template.format_map(values)
+
+
+# Descriptions for common canary failure status codes
+_STATUS_DESC = {
+    "429": "(rate limited)",
+    "503": "(service unavailable)",
+    "404": "(not found)",
+    "500": "(server error)",
+    "TIMEOUT": "(request timeout)",
+}
+
+# Icon and description per CloudFlare cache status (CSV summary)
+_CF_META = {
+    "HIT": ("✅", "(served from CloudFlare cache)"),
+    "STALE": ("⚠️", "(stale content, passed to backend)"),
+    "MISS": ("❌", "(not in cache, passed to backend)"),
+    "EXPIRED": ("🔄", "(cache expired, backend building new entry)"),
+    "DYNAMIC": ("🔄", "(dynamic content, bypassed cache)"),
+}
+
+# Sort key for (name, count) pairs; C-level, no Python frame per comparison
+_BY_COUNT = itemgetter(1)
+
+# One "<icon> <name>: <count> requests (<pct>%)" line of the CF breakdowns
+_OUTCOME_LINE = "   {icon} {name}: {cnt:,} requests ({pct:.1f}%)"
+
+# Display order, icons and descriptions for the SQLite cross-tab breakdown
+_STATUS_ORDER = ("HIT", "STALE", "MISS", "EXPIRED", "DYNAMIC")
+_STATUS_INFO = {
+    "HIT": ("✅", "served from CF cache"),
+    "STALE": ("⚠️", "CF serving cached content (marked as stale)"),
+    "MISS": ("❌", "no CF cache, forwarded to backend"),
+    "EXPIRED": ("🔄", "cache expired, backend contacted for fresh content"),
+    "DYNAMIC": ("🔄", "dynamic content, bypassed cache"),
+}
+
+# Icons and descriptions for the simple breakdown (no cross-tab available)
+_BREAKDOWN_INFO = {
+    "HIT": ("✅", "Served directly from CloudFlare cache"),
+    "STALE": ("⚠️", "CF serving cached content (marked as stale)"),
+    "MISS": ("❌", "No cache entry found, forwarded to backend"),
+    "EXPIRED": ("🔄", "Cache expired, backend contacted for fresh content"),
+    "DYNAMIC": ("🔄", "Dynamic content, bypasses cache entirely"),
+}
+
+
+@dataclass
+class CanaryTarget:
+    """Aggregated canary statistics for one response target"""
+    __slots__ = ("name", "total_requests", "total_successes", "success_rate", "data")
+    name: str
+    total_requests: int
+    total_successes: int
+    success_rate: float
+    data: Dict
+
+
+def _collect_canary_targets(storage) -> Tuple[List[CanaryTarget], int, int]:
+    """Build per-target canary records plus overall request/success totals in one pass"""
+    targets: Dict[str, CanaryTarget] = {}
     
-    config_lines = [
-        "📋 Key Configuration Settings:",
-        f"   Connection & Security:",
-        f"     • lidarr_timeout: {cfg.get('lidarr_timeout', 60)}s",
-        f"     • verify_ssl: {cfg.get('verify_ssl', True)}",
-        f"   API Rate Limiting:",
-        f"     • max_concurrent_requests: {cfg.get('max_concurrent_requests', 5)}",
-        f"     • rate_limit_per_second: {cfg.get('rate_limit_per_second', 3)}",
-        f"     • delay_between_attempts: {cfg.get('delay_between_attempts', 0.5)}s",
-        f"   Cache Warming Attempts:",
-        f"     • max_attempts_per_artist: {cfg.get('max_attempts_per_artist', 25)}",
-        f"     • max_attempts_per_artist_textsearch: {cfg.get('max_attempts_per_artist_textsearch', 25)}",
-        f"     • max_attempts_per_rg: {cfg.get('max_attempts_per_rg', 15)}",
-        f"   Processing Options:",
-        f"     • process_release_groups: {cfg.get('process_release_groups', False)}",
-        f"     • process_artist_textsearch: {cfg.get('process_artist_textsearch', True)}",
-        f"     • batch_size: {cfg.get('batch_size', 25)}",
-        f"     • cache_recheck_hours: {cfg.get('cache_recheck_hours', 72)}",
-        f"   Text Search Processing:",
-        f"     • artist_textsearch_lowercase: {cfg.get('artist_textsearch_lowercase', False)}",
-        f"     • artist_textsearch_transliterate_unicode: {cfg.get('artist_textsearch_transliterate_unicode', False)}",
-        f"     • artist_textsearch_remove_symbols: {cfg.get('artist_textsearch_remove_symbols', False)} (deprecated)",
-        f"   Storage Backend:",
-        f"     • storage_type: {storage_type}",
-    ]
-    
-    if storage_type == "sqlite":
-        config_lines.append(f"     • db_path: {cfg.get('db_path', 'mbid_cache.db')}")
+    if hasattr(storage, "iter_canary_aggregates"):
+        # SQLite: consume the grouped rows directly
+        for target_name, op_type, op_requests, op_successes, first_seen, last_seen in storage.iter_canary_aggregates():
+            target = targets.get(target_name)
+            if target is None:
+                target = targets[target_name] = CanaryTarget(
+                    target_name, 0, 0, 0.0, {"first_seen": first_seen, "last_seen": last_seen, "operations": {}}
+                )
+            target_data = target.data
+            if first_seen < target_data["first_seen"]:
+                target_data["first_seen"] = first_seen
+            if last_seen > target_data["last_seen"]:
+                target_data["last_seen"] = last_seen
+            
+            target_data["operations"][op_type] = {
+                "total_requests": op_requests,
+                "successful_requests": op_successes,
+                "success_rate": (op_successes / op_requests * 100) if op_requests > 0 else 0.0
+            }
+            target.total_requests += op_requests
+            target.total_successes += op_successes
     else:
-        config_lines.extend([
-            f"     • artists_csv_path: {cfg.get('artists_csv_path', 'mbid-artists.csv')}",
-            f"     • release_groups_csv_path: {cfg.get('release_groups_csv_path', 'mbid-releasegroups.csv')}"
-        ])
+        for target_name, target_data in storage.get_canary_statistics().items():
+            target = targets[target_name] = CanaryTarget(target_name, 0, 0, 0.0, target_data)
+            for op_stats in target_data.get("operations", {}).values():
+                target.total_requests += op_stats["total_requests"]
+                target.total_successes += op_stats["successful_requests"]
+    
+    # Success rate is computed once here and reused by every printer below
+    total_requests = 0
+    total_successes = 0
+    for target in targets.values():
+        if target.total_requests > 0:
+            target.success_rate = target.total_successes / target.total_requests * 100
+        total_requests += target.total_requests
+        total_successes += target.total_successes
     
-    return "\n".join(config_lines)
+    return list(targets.values()), total_requests, total_successes
 
 
+@_buffered_output()
 def print_canary_analysis(storage) -> None:
     """Print detailed canary response target analysis"""
     print()
@@ -243,9 +566,9 @@ def print_canary_analysis(storage) -> None:
     print("=" * 60)
     
     try:
-        canary_stats = storage.get_canary_statistics()
+        sorted_targets, total_requests, total_successes = _collect_canary_targets(storage)
         
-        if not canary_stats:
+        if not sorted_targets:
             print("📊 No canary response data available")
             print("   This is normal for:")
             print("   • CSV storage (limited canary tracking)")
@@ -253,18 +576,9 @@ def print_canary_analysis(storage) -> None:
             print("   • APIs that don't set x-canary-response-target header")
             return
         
-        print(f"📊 Found {len(canary_stats)} canary targets with response data")
+        print(f"📊 Found {len(sorted_targets)} canary targets with response data")
         print()
         
-        # Calculate overall statistics
-        total_requests = 0
-        total_successes = 0
-        
-        for target_name, target_data in canary_stats.items():
-            for op_type, op_stats in target_data.get("operations", {}).items():
-                total_requests += op_stats["total_requests"]
-                total_successes += op_stats["successful_requests"]
-        
         overall_success_rate = (total_successes / total_requests * 100) if total_requests > 0 else 0.0
         
         print(f"🌐 OVERALL CANARY STATISTICS:")
@@ -278,42 +592,29 @@ def print_canary_analysis(storage) -> None:
             print(f"   Total failed requests: {total_failures:,}")
             
             # Get failure breakdown by status code (only works with SQLite storage)
-            if hasattr(storage, 'db_path') and os.path.exists(storage.db_path):
+            if storage.supports_sql:
                 try:
-                    with sqlite3.connect(storage.db_path) as conn:
-                        conn.row_factory = sqlite3.Row
-                        cursor = conn.execute("""
-                            SELECT status_code, COUNT(*) as count
-                            FROM canary_responses 
-                            WHERE success = 0 AND canary_target != ''
-                            GROUP BY status_code
-                            ORDER BY count DESC
-                        """)
-                        
-                        failure_codes = cursor.fetchall()
-                        if failure_codes:
-                            print(f"   Failure breakdown:")
-                            for row in failure_codes:
-                                status_code = row["status_code"]
-                                count = row["count"]
-                                
-                                # Add description for common status codes
-                                if status_code == "429":
-                                    description = "(rate limited)"
-                                elif status_code == "503":
-                                    description = "(service unavailable)"
-                                elif status_code == "404":
-                                    description = "(not found)"
-                                elif status_code == "500":
-                                    description = "(server error)"
-                                elif status_code.startswith("EXC:"):
-                                    description = "(connection exception)"
-                                elif status_code == "TIMEOUT":
-                                    description = "(request timeout)"
-                                else:
-                                    description = ""
-                                
-                                print(f"     • {count} × HTTP {status_code} {description}")
+                    failure_codes = storage.query("""
+                        SELECT status_code, SUM(total - success) as count
+                        FROM canary_rollup 
+                        WHERE canary_target != ''
+                        GROUP BY status_code
+                        HAVING count > 0
+                        ORDER BY count DESC
+                    """)
+                    
+                    if failure_codes:
+                        print(f"   Failure breakdown:")
+                        for row in failure_codes:
+                            status_code = row["status_code"]
+                            count = row["count"]
+                            
+                            # Add description for common status codes
+                            description = _STATUS_DESC.get(
+                                status_code, "(connection exception)" if status_code.startswith("EXC:") else ""
+                            )
+                            
+                            print(f"     • {count} × HTTP {status_code} {description}")
                 except Exception as e:
                     print(f"   (Could not retrieve failure breakdown: {e})")
         
@@ -322,58 +623,28 @@ def print_canary_analysis(storage) -> None:
         # Show successful request distribution between targets
         if total_successes > 0:
             print(f"📊 SUCCESSFUL REQUEST DISTRIBUTION:")
-            success_distribution = []
-            for target_name, target_data in canary_stats.items():
-                target_successes = 0
-                for op_stats in target_data.get("operations", {}).values():
-                    target_successes += op_stats["successful_requests"]
-                
-                if target_successes > 0:
-                    success_percentage = (target_successes / total_successes * 100)
-                    success_distribution.append({
-                        "name": target_name,
-                        "successes": target_successes,
-                        "percentage": success_percentage
-                    })
-            
             # Sort by success count (highest first)
-            success_distribution.sort(key=lambda x: x["successes"], reverse=True)
+            success_distribution = sorted(
+                (target for target in sorted_targets if target.total_successes > 0),
+                key=lambda x: x.total_successes, reverse=True
+            )
             
-            for dist in success_distribution:
-                print(f"   {dist['name']}: {dist['successes']:,} successful requests ({dist['percentage']:.1f}%)")
+            for target in success_distribution:
+                success_percentage = (target.total_successes / total_successes * 100)
+                print(f"   {target.name}: {target.total_successes:,} successful requests ({success_percentage:.1f}%)")
             print()
         
-        # Sort targets by success rate (lowest first to highlight problems)
-        sorted_targets = []
-        for target_name, target_data in canary_stats.items():
-            target_total_requests = 0
-            target_total_successes = 0
-            
-            for op_stats in target_data.get("operations", {}).values():
-                target_total_requests += op_stats["total_requests"]
-                target_total_successes += op_stats["successful_requests"]
-            
-            target_success_rate = (target_total_successes / target_total_requests * 100) if target_total_requests > 0 else 0.0
-            
-            sorted_targets.append({
-                "name": target_name,
-                "success_rate": target_success_rate,
-                "total_requests": target_total_requests,
-                "total_successes": target_total_successes,
-                "data": target_data
-            })
-        
         # Sort by success rate (lowest first)
-        sorted_targets.sort(key=lambda x: x["success_rate"])
+        sorted_targets.sort(key=lambda x: x.success_rate)
         
         print("🎯 CANARY TARGET BREAKDOWN (sorted by success rate):")
         print()
         
         for target in sorted_targets:
-            target_name = target["name"]
-            target_success_rate = target["success_rate"]
-            target_requests = target["total_requests"]
-            target_data = target["data"]
+            target_name = target.name
+            target_success_rate = target.success_rate
+            target_requests = target.total_requests
+            target_data = target.data
             
             # Color code based on success rate
             if target_success_rate >= 95:
@@ -384,16 +655,16 @@ def print_canary_analysis(storage) -> None:
                 status_icon = "❌"
             
             print(f"{status_icon} {target_name}")
-            print(f"   Overall: {target_success_rate:.1f}% success ({target["total_successes"]:,}/{target_requests:,} requests)")
+            print(f"   Overall: {target_success_rate:.1f}% success ({target.total_successes:,}/{target_requests:,} requests)")
             
             # Show first/last seen if available
             if "first_seen" in target_data and "last_seen" in target_data:
-                try:
-                    first_seen = datetime.fromisoformat(target_data["first_seen"].replace('Z', '+00:00'))
-                    last_seen = datetime.fromisoformat(target_data["last_seen"].replace('Z', '+00:00'))
+                first_ts = _parse_ts(target_data["first_seen"])
+                last_ts = _parse_ts(target_data["last_seen"])
+                if first_ts is not None and last_ts is not None:
+                    first_seen = datetime.fromtimestamp(first_ts, _UTC)
+                    last_seen = datetime.fromtimestamp(last_ts, _UTC)
                     print(f"   Active: {first_seen.strftime('%Y-%m-%d %H:%M')} to {last_seen.strftime('%Y-%m-%d %H:%M')} UTC")
-                except Exception:
-                    pass
             
             # Break down by operation type
             operations = target_data.get("operations", {})
@@ -419,24 +690,24 @@ def print_canary_analysis(storage) -> None:
         # Recommendations
         print("🚀 CANARY ANALYSIS RECOMMENDATIONS:")
         
-        problem_targets = [t for t in sorted_targets if t["success_rate"] < 80]
-        warning_targets = [t for t in sorted_targets if 80 <= t["success_rate"] < 95]
+        problem_targets = [t for t in sorted_targets if t.success_rate < 80]
+        warning_targets = [t for t in sorted_targets if 80 <= t.success_rate < 95]
         
         if problem_targets:
             print(f"   ❌ {len(problem_targets)} target(s) with concerning success rates (<80%):")
             for target in problem_targets[:3]:  # Show top 3 worst
-                print(f"      • {target['name']}: {target['success_rate']:.1f}% success")
+                print(f"      • {target.name}: {target.success_rate:.1f}% success")
             if len(problem_targets) > 3:
                 print(f"      • ... and {len(problem_targets) - 3} more")
         
         if warning_targets:
             print(f"   ⚠️  {len(warning_targets)} target(s) with moderate success rates (80-95%):")
             for target in warning_targets[:2]:  # Show top 2
-                print(f"      • {target['name']}: {target['success_rate']:.1f}% success")
+                print(f"      • {target.name}: {target.success_rate:.1f}% success")
             if len(warning_targets) > 2:
                 print(f"      • ... and {len(warning_targets) - 2} more")
         
-        good_targets = [t for t in sorted_targets if t["success_rate"] >= 95]
+        good_targets = [t for t in sorted_targets if t.success_rate >= 95]
         if good_targets:
             print(f"   ✅ {len(good_targets)} target(s) performing well (≥95% success rate)")
         
@@ -455,6 +726,35 @@ def print_canary_analysis(storage) -> None:
         print("   • Missing database tables (try running cache warmer once)")
 
 
+def _render_status_block(cf_status: str, outcomes: Dict[str, int], status_total: int,
+                         inv_total: float, status_scale: float, success_outcomes: Set[str]) -> None:
+    """Print one cross-tab block: status header, total and its outcomes by count"""
+    icon, desc = _STATUS_INFO.get(cf_status, ("❓", "other cache status"))
+    print(f"{icon} {cf_status} ({desc}):")
+    print(f"   Total: {status_total:,} requests ({status_total * inv_total:.1f}%)")
+    
+    # Sort by count (descending) and render the whole block in one go
+    sorted_outcomes = sorted(outcomes.items(), key=_BY_COUNT, reverse=True)
+    if NUMPY_AVAILABLE and len(sorted_outcomes) >= NUMPY_MIN_OUTCOMES:
+        counts = np.fromiter((count for _, count in sorted_outcomes), dtype=np.int64, count=len(sorted_outcomes))
+        pcts = (counts * status_scale).tolist()
+    else:
+        pcts = [count * status_scale for _, count in sorted_outcomes]
+    lines = [_OUTCOME_LINE.format(icon="✅" if outcome in success_outcomes else "❌", name=outcome,
+                                  cnt=count, pct=pct)
+             for (outcome, count), pct in zip(sorted_outcomes, pcts)]
+    print("\n".join(lines) + "\n")
+
+
+def _render_flat_status(status: str, count: int, percentage: float) -> None:
+    """Print one status of the simple breakdown (no cross-tab available)"""
+    icon, description = _BREAKDOWN_INFO.get(status, ("❓", f"Other cache status: {status}"))
+    print(_OUTCOME_LINE.format(icon=icon, name=status, cnt=count, pct=percentage))
+    print(f"      {description}")
+    print()
+
+
+@_buffered_output()
 def print_cf_cache_analysis(storage) -> None:
     """Print detailed CloudFlare cache status analysis"""
     print()
@@ -488,29 +788,12 @@ def print_cf_cache_analysis(storage) -> None:
             
             # Show basic distribution
             print("☁️ CLOUDFLARE CACHE STATUS DISTRIBUTION:")
-            for status, count in sorted(basic_counts.items(), key=lambda x: x[1], reverse=True):
+            for status, count in sorted(basic_counts.items(), key=_BY_COUNT, reverse=True):
                 if count > 0:
                     percentage = (count / total_responses) * 100
                     
                     # Add icons and descriptions
-                    if status == "HIT":
-                        icon = "✅"
-                        description = "(served from CloudFlare cache)"
-                    elif status == "STALE":
-                        icon = "⚠️"
-                        description = "(stale content, passed to backend)"
-                    elif status == "MISS":
-                        icon = "❌"
-                        description = "(not in cache, passed to backend)"
-                    elif status == "EXPIRED":
-                        icon = "🔄"
-                        description = "(cache expired, backend building new entry)"
-                    elif status == "DYNAMIC":
-                        icon = "🔄"
-                        description = "(dynamic content, bypassed cache)"
-                    else:
-                        icon = "❓"
-                        description = f"(other status: {status})"
+                    icon, description = _CF_META.get(status, ("❓", f"(other status: {status})"))
                     
                     print(f"   {icon} {status}: {count:,} responses ({percentage:.1f}%) {description}")
             
@@ -527,6 +810,7 @@ def print_cf_cache_analysis(storage) -> None:
             return
         
         print(f"📊 Found {len(cf_stats)} cache status types with {total_requests:,} total requests")
+        inv_total = 100.0 / total_requests  # Percentages below are count * inv_total
         print()
         
         # Calculate key metrics based on actual behavior, not just cache status
@@ -535,67 +819,85 @@ def print_cf_cache_analysis(storage) -> None:
         cached_error_responses = 0    # STALE + 503 (cached error responses)
         other_responses = 0
         
-        if hasattr(storage, 'db_path') and os.path.exists(storage.db_path):
+        # Cross-tabulation data is built from the same query
+        cross_tab_data = {}
+        success_outcomes = set()  # Outcome keys whose rows had success = 1
+        cross_tab_error = None
+        
+        if storage.supports_sql:
             try:
-                with sqlite3.connect(storage.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.execute("""
-                        SELECT 
-                            cf_cache_status,
-                            status_code,
-                            success,
-                            COUNT(*) as count
-                        FROM cf_cache_responses 
-                        WHERE cf_cache_status != ''
-                        GROUP BY cf_cache_status, status_code, success
-                        ORDER BY cf_cache_status, status_code
-                    """)
+                # Same connection get_cf_cache_statistics used above; the daily rollup keeps
+                # success counts, so failed (0) and successful (1) rows are split out here.
+                # The ORDER BY merges the two halves back into the report's row order
+                rows = storage.query("""
+                    SELECT cf_cache_status, status_code, 0 as success, SUM(total - success) as count
+                    FROM cf_cache_rollup 
+                    WHERE cf_cache_status != ''
+                    GROUP BY cf_cache_status, status_code
+                    HAVING count > 0
+                    UNION ALL
+                    SELECT cf_cache_status, status_code, 1 as success, SUM(success) as count
+                    FROM cf_cache_rollup 
+                    WHERE cf_cache_status != ''
+                    GROUP BY cf_cache_status, status_code
+                    HAVING count > 0
+                    ORDER BY cf_cache_status, status_code, success
+                """)
+                
+                for row in rows:
+                    cf_status = row["cf_cache_status"]
+                    status_code = row["status_code"]
+                    success = bool(row["success"])
+                    count = row["count"]
                     
-                    for row in cursor:
-                        cf_status = row["cf_cache_status"]
-                        status_code = row["status_code"]
-                        success = bool(row["success"])
-                        count = row["count"]
-                        
-                        if cf_status == "HIT" and success:
-                            hit_responses += count
-                        elif cf_status == "STALE" and success and status_code == "200":
-                            cached_success_responses += count
-                        elif cf_status == "STALE" and not success and status_code == "503":
-                            cached_error_responses += count
-                        else:
-                            other_responses += count
+                    if cf_status == "HIT" and success:
+                        hit_responses += count
+                    elif cf_status == "STALE" and success and status_code == "200":
+                        cached_success_responses += count
+                    elif cf_status == "STALE" and not success and status_code == "503":
+                        cached_error_responses += count
+                    else:
+                        other_responses += count
+                    
+                    if cf_status not in cross_tab_data:
+                        cross_tab_data[cf_status] = {}
+                    
+                    outcome = "SUCCESS" if success else "TIMEOUT"
+                    key = f"{status_code} {outcome}"
+                    cross_tab_data[cf_status][key] = count
+                    if success:
+                        success_outcomes.add(key)
                         
-            except Exception:
-                pass
+            except Exception as e:
+                cross_tab_error = e
         
         # User-friendly summary based on actual cache behavior
         print("📋 CLOUDFLARE CACHE ANALYSIS:")
         print()
         
         if hit_responses > 0:
-            hit_percentage = (hit_responses / total_requests) * 100
+            hit_percentage = hit_responses * inv_total
             print(f"   ✅ Served from active cache: {hit_responses:,} requests ({hit_percentage:.1f}%)")
             print(f"      True cache hits - optimal performance")
             print(f"      (cf-cache-status: HIT + HTTP Code: 200)")
             print()
         
         if cached_success_responses > 0:
-            cached_success_percentage = (cached_success_responses / total_requests) * 100
+            cached_success_percentage = cached_success_responses * inv_total
             print(f"   📋 Served cached successful responses: {cached_success_responses:,} requests ({cached_success_percentage:.1f}%)")
             print(f"      CF serving cached 200 responses with full payload (marked as STALE)")
             print(f"      (cf-cache-status: STALE + HTTP Code: 200)")
             print()
         
         if cached_error_responses > 0:
-            cached_error_percentage = (cached_error_responses / total_requests) * 100
+            cached_error_percentage = cached_error_responses * inv_total
             print(f"   ❌ Served cached error responses: {cached_error_responses:,} requests ({cached_error_percentage:.1f}%)")
             print(f"      CF serving cached 503 responses - no useful payload")
             print(f"      (cf-cache-status: STALE + HTTP Code: 503)")
             print()
         
         if other_responses > 0:
-            other_percentage = (other_responses / total_requests) * 100
+            other_percentage = other_responses * inv_total
             print(f"   ❓ Other cache behaviors: {other_responses:,} requests ({other_percentage:.1f}%)")
             print(f"      MISS, EXPIRED, or other CF cache statuses")
             print()
@@ -603,107 +905,33 @@ def print_cf_cache_analysis(storage) -> None:
         # Calculate useful response rate
         useful_responses = hit_responses + cached_success_responses
         if total_requests > 0:
-            useful_rate = (useful_responses / total_requests) * 100
+            useful_rate = useful_responses * inv_total
             print(f"📊 USEFUL RESPONSES: {useful_rate:.1f}% of requests returned actual data")
             
             if cached_error_responses > 0:
-                error_rate = (cached_error_responses / total_requests) * 100
+                error_rate = cached_error_responses * inv_total
                 print(f"⚠️  {error_rate:.1f}% of requests returned cached errors (useless)")
         
         print()
         
-        # Get cross-tabulation data from SQLite if available
-        cross_tab_data = {}
-        
-        if hasattr(storage, 'db_path') and os.path.exists(storage.db_path):
-            try:
-                with sqlite3.connect(storage.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.execute("""
-                        SELECT 
-                            cf_cache_status,
-                            status_code,
-                            success,
-                            COUNT(*) as count
-                        FROM cf_cache_responses 
-                        WHERE cf_cache_status != ''
-                        GROUP BY cf_cache_status, status_code, success
-                        ORDER BY cf_cache_status, status_code
-                    """)
-                    
-                    for row in cursor:
-                        cf_status = row["cf_cache_status"]
-                        status_code = row["status_code"]
-                        success = bool(row["success"])
-                        count = row["count"]
-                        
-                        if cf_status not in cross_tab_data:
-                            cross_tab_data[cf_status] = {}
-                        
-                        outcome = "SUCCESS" if success else "TIMEOUT"
-                        key = f"{status_code} {outcome}"
-                        cross_tab_data[cf_status][key] = count
-                        
-            except Exception as e:
-                print(f"   (Could not retrieve detailed cross-tabulation: {e})")
+        if cross_tab_error is not None:
+            print(f"   (Could not retrieve detailed cross-tabulation: {cross_tab_error})")
         
         # Cross-tabulation breakdown
         if cross_tab_data:
             print("☁️ CACHE STATUS vs BACKEND RESPONSE:")
             print()
             
-            # Define status order and icons
-            status_order = ["HIT", "STALE", "MISS", "EXPIRED", "DYNAMIC"]
-            status_info = {
-                "HIT": {"icon": "✅", "desc": "served from CF cache"},
-                "STALE": {"icon": "⚠️", "desc": "CF serving cached content (marked as stale)"},
-                "MISS": {"icon": "❌", "desc": "no CF cache, forwarded to backend"},
-                "EXPIRED": {"icon": "🔄", "desc": "cache expired, backend contacted for fresh content"},
-                "DYNAMIC": {"icon": "🔄", "desc": "dynamic content, bypassed cache"}
-            }
+            # Per-status totals and percentage scales, computed once for both render loops
+            totals = {s: sum(v.values()) for s, v in cross_tab_data.items()}
+            status_scales = {s: (100.0 / n if n else 0.0) for s, n in totals.items()}
             
-            for cf_status in status_order:
-                if cf_status not in cross_tab_data:
-                    continue
-                    
-                info = status_info.get(cf_status, {"icon": "❓", "desc": f"other status: {cf_status}"})
-                total_for_status = sum(cross_tab_data[cf_status].values())
-                percentage = (total_for_status / total_requests * 100)
-                
-                print(f"{info['icon']} {cf_status} ({info['desc']}):")
-                print(f"   Total: {total_for_status:,} requests ({percentage:.1f}%)")
-                
-                # Sort by count (descending)
-                sorted_outcomes = sorted(cross_tab_data[cf_status].items(), key=lambda x: x[1], reverse=True)
-                
-                for outcome, count in sorted_outcomes:
-                    outcome_percentage = (count / total_for_status * 100) if total_for_status > 0 else 0
-                    
-                    # Parse outcome
-                    if "SUCCESS" in outcome:
-                        outcome_icon = "✅"
-                    else:
-                        outcome_icon = "❌"
-                    
-                    print(f"   {outcome_icon} {outcome}: {count:,} requests ({outcome_percentage:.1f}%)")
-                
-                print()
-            
-            # Show any remaining statuses not in our predefined list
-            for cf_status in cross_tab_data:
-                if cf_status not in status_order:
-                    total_for_status = sum(cross_tab_data[cf_status].values())
-                    percentage = (total_for_status / total_requests * 100)
-                    
-                    print(f"❓ {cf_status} (other cache status):")
-                    print(f"   Total: {total_for_status:,} requests ({percentage:.1f}%)")
-                    
-                    sorted_outcomes = sorted(cross_tab_data[cf_status].items(), key=lambda x: x[1], reverse=True)
-                    for outcome, count in sorted_outcomes:
-                        outcome_percentage = (count / total_for_status * 100) if total_for_status > 0 else 0
-                        outcome_icon = "✅" if "SUCCESS" in outcome else "❌"
-                        print(f"   {outcome_icon} {outcome}: {count:,} requests ({outcome_percentage:.1f}%)")
-                    print()
+            # Known statuses in display order, then anything else in query order
+            render_order = [s for s in _STATUS_ORDER if s in cross_tab_data]
+            render_order += [s for s in cross_tab_data if s not in _STATUS_INFO]
+            for cf_status in render_order:
+                _render_status_block(cf_status, cross_tab_data[cf_status], totals[cf_status],
+                                     inv_total, status_scales[cf_status], success_outcomes)
         
         else:
             # Fallback to simple breakdown if cross-tabulation not available
@@ -716,31 +944,8 @@ def print_cf_cache_analysis(storage) -> None:
             
             for status, status_data in sorted_statuses:
                 count = status_data["total_requests"]
-                percentage = (count / total_requests) * 100
-                
-                # Add icons and descriptions
-                if status == "HIT":
-                    icon = "✅"
-                    description = "Served directly from CloudFlare cache"
-                elif status == "STALE":
-                    icon = "⚠️"
-                    description = "CF serving cached content (marked as stale)"
-                elif status == "MISS":
-                    icon = "❌"
-                    description = "No cache entry found, forwarded to backend"
-                elif status == "EXPIRED":
-                    icon = "🔄"
-                    description = "Cache expired, backend contacted for fresh content"
-                elif status == "DYNAMIC":
-                    icon = "🔄"
-                    description = "Dynamic content, bypasses cache entirely"
-                else:
-                    icon = "❓"
-                    description = f"Other cache status: {status}"
-                
-                print(f"   {icon} {status}: {count:,} requests ({percentage:.1f}%)")
-                print(f"      {description}")
-                print()
+                percentage = count * inv_total
+                _render_flat_status(status, count, percentage)
         
     except Exception as e:
         print(f"❌ Error analyzing CloudFlare cache data: {e}")
@@ -750,12 +955,101 @@ def print_cf_cache_analysis(storage) -> None:
         print("   • Missing database tables (try running cache warmer once)")
 
 
-def print_stats_report(cfg: dict, show_canary_stats: bool = False):
-    """Generate and print comprehensive stats report"""
+def print_stats_report(cfg: dict, show_canary_stats: bool = False, storage=None):
+    """Generate and print comprehensive stats report; returns the storage backend used (None on error)"""
+    # Header goes out before the (possibly slow) Lidarr fetch, the rest in one write
+    with _buffered_output():
+        loaded = _load_report_storage(cfg, storage)
+        if loaded is None:
+            return None
+        
+        storage, artist_stats, rg_stats = loaded
+        # Fresh install: skip the Lidarr fetch and the full report
+        if artist_stats["total"] == 0 and rg_stats.get("total", 0) == 0:
+            print("📭 No data yet - run the cache warmer once to populate the ledger")
+            print()
+            print("=" * 60)
+            return storage
+        
+        print("📡 Fetching current data from Lidarr...")
     
+    lidarr_artist_count, lidarr_rg_count = _fetch_lidarr_counts(cfg, artist_stats, rg_stats)
+    _print_report_sections(cfg, show_canary_stats, storage, artist_stats, rg_stats,
+                           lidarr_artist_count, lidarr_rg_count)
+    return storage
+
+
+# Last analysis results, reused by back-to-back runs against unchanged ledgers
+_SNAPSHOT_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                              "lidarr-cache-warmer", "stats.json")
+
+
+def _snapshot_key(storage, cfg: dict) -> Optional[str]:
+    """Identify the CSV ledgers' current state and the config the analysis depends on"""
+    # SQLite already aggregates in SQL, and opening it rewrites the -wal file, so its
+    # file stats can't key the snapshot; only CSV ledgers are snapshotted
+    if storage.supports_sql:
+        return None
+    
+    files = []
+    for path in [storage.artists_csv_path, storage.release_groups_csv_path]:
+        try:
+            st = os.stat(path)
+            files.append([os.path.abspath(path), st.st_mtime_ns, st.st_size])
+        except OSError:
+            files.append([os.path.abspath(path), None, None])
+    
+    return json.dumps({
+        "files": files,
+        "cache_recheck_hours": cfg.get("cache_recheck_hours", 72),
+        "process_release_groups": bool(cfg.get("process_release_groups", False)),
+    }, sort_keys=True)
+
+
+def _load_stats_snapshot(key: str) -> Optional[Tuple[Dict[str, any], Dict[str, any]]]:
+    """Return the saved (artist_stats, rg_stats) if still valid for key at the current time"""
+    try:
+        with open(_SNAPSHOT_PATH, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot["key"] != key:
+            return None
+        elapsed_hours = (time.time() - snapshot["saved_at"]) / 3600
+        artist_stats, rg_stats = snapshot["artist_stats"], snapshot["rg_stats"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if elapsed_hours < 0:
+        return None
+    
+    # Stale counts only change once the next fresh entry crosses the threshold
+    for section in (artist_stats, rg_stats):
+        next_hours = section.get("next_recheck_hours", 0)
+        if next_hours > 0:
+            if elapsed_hours >= next_hours:
+                return None
+            section["next_recheck_hours"] = next_hours - elapsed_hours
+    
+    return artist_stats, rg_stats
+
+
+def _save_stats_snapshot(key: str, artist_stats: Dict[str, any], rg_stats: Dict[str, any]) -> None:
+    """Write the analysis snapshot atomically; an unwritable cache dir just disables it"""
+    snapshot = {"key": key, "saved_at": time.time(), "artist_stats": artist_stats, "rg_stats": rg_stats}
+    try:
+        os.makedirs(os.path.dirname(_SNAPSHOT_PATH), exist_ok=True)
+        tmp_path = _SNAPSHOT_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, _SNAPSHOT_PATH)
+    except OSError:
+        pass
+
+
+def _load_report_storage(cfg: dict, storage=None):
+    """Print the report header and analyze the ledgers; returns None on error"""
     print("=" * 60)
     print("🎵 LIDARR CACHE WARMER - STATISTICS REPORT")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     
     # Configuration summary
@@ -764,61 +1058,81 @@ def print_stats_report(cfg: dict, show_canary_stats: bool = False):
     
     # Create storage backend and load data
     try:
-        # Check if storage files exist before creating backend
-        storage_type = cfg.get("storage_type", "csv").lower()
-        
-        if storage_type == "sqlite":
-            db_path = cfg.get("db_path", "mbid_cache.db")
-            if not os.path.exists(db_path):
-                print(f"❌ ERROR: SQLite database not found at {db_path}")
+        # Check the paths before building a backend: opening SQLite would create the file
+        found = storage.is_initialized() if storage is not None else storage_exists(cfg)
+        if not found:
+            if cfg.get("storage_type", "csv").lower() == "sqlite":
+                print(f"❌ ERROR: SQLite database not found at {cfg.get('db_path', 'mbid_cache.db')}")
                 print(f"   Run the cache warmer first to create the database")
-                return
-        else:
-            artists_csv = cfg.get("artists_csv_path", "mbid-artists.csv") 
-            if not os.path.exists(artists_csv):
-                print(f"❌ ERROR: Artists CSV not found at {artists_csv}")
+            else:
+                print(f"❌ ERROR: Artists CSV not found at {cfg.get('artists_csv_path', 'mbid-artists.csv')}")
                 print(f"   Run the cache warmer first to create the CSV files")
-                return
+            return None
+        if storage is None:
+            storage = create_storage_backend(cfg)
         
-        storage = create_storage_backend(cfg)
-        artists_ledger = storage.read_artists_ledger()
-        rg_ledger = storage.read_release_groups_ledger()
+        # Reuse the last run's analysis while the ledgers are untouched
+        snapshot_key = _snapshot_key(storage, cfg)
+        snapshot = _load_stats_snapshot(snapshot_key) if snapshot_key is not None else None
+        if snapshot is not None:
+            artist_stats, rg_stats = snapshot
+            return storage, artist_stats, rg_stats
+        
+        # SQLite aggregates in SQL, so only CSV needs the ledger rows in memory
+        sql_summaries = hasattr(storage, "get_artist_staleness_summary")
+        recheck_hours = cfg.get("cache_recheck_hours", 72)
+        artist_stats = analyze_artists_stats(
+            {} if sql_summaries else storage.read_artists_ledger(), recheck_hours, storage)
+        rg_stats = {}
+        if cfg.get("process_release_groups", False):
+            rg_stats = analyze_release_groups_stats(
+                {} if sql_summaries else storage.read_release_groups_ledger(), recheck_hours, storage)
+        if snapshot_key is not None:
+            _save_stats_snapshot(snapshot_key, artist_stats, rg_stats)
     except Exception as e:
         print(f"❌ ERROR: Could not read storage: {e}")
-        return
+        return None
     
-    # Fetch current Lidarr data for comparison
-    try:
-        print("📡 Fetching current data from Lidarr...")
-        lidarr_artists = get_lidarr_artists(
-            cfg["lidarr_url"], 
-            cfg["api_key"], 
-            cfg.get("verify_ssl", True),
-            cfg.get("lidarr_timeout", 60)
-        )
-        lidarr_artist_count = len(lidarr_artists)
+    return storage, artist_stats, rg_stats
+
+
+def _fetch_lidarr_counts(cfg: dict, artist_stats: Dict[str, any], rg_stats: Dict[str, any]) -> Tuple[int, int]:
+    """Fetch current artist/release group counts from Lidarr, falling back to the ledgers"""
+    lidarr_args = (cfg["lidarr_url"], cfg["api_key"], cfg.get("verify_ssl", True), cfg.get("lidarr_timeout", 60))
+    
+    # Both endpoints are independent round-trips; issue them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        artists_future = executor.submit(get_lidarr_artists, *lidarr_args)
+        rgs_future = (executor.submit(get_lidarr_release_groups, *lidarr_args)
+                      if cfg.get("process_release_groups", False) else None)
         
-        if cfg.get("process_release_groups", False):
-            lidarr_rgs = get_lidarr_release_groups(
-                cfg["lidarr_url"], 
-                cfg["api_key"], 
-                cfg.get("verify_ssl", True),
-                cfg.get("lidarr_timeout", 60)
-            )
-            lidarr_rg_count = len(lidarr_rgs)
-        else:
+        try:
+            lidarr_artist_count = len(artists_future.result())
+        except Exception as e:
+            print(f"⚠️ WARNING: Could not fetch Lidarr artists: {e}")
+            print("    Using ledger data only...")
+            lidarr_artist_count = artist_stats["total"]
+        
+        if rgs_future is None:
             lidarr_rg_count = 0
-            
-    except Exception as e:
-        print(f"⚠️ WARNING: Could not fetch Lidarr data: {e}")
-        print("    Using ledger data only...")
-        lidarr_artist_count = len(artists_ledger)
-        lidarr_rg_count = len(rg_ledger)
+        else:
+            try:
+                lidarr_rg_count = len(rgs_future.result())
+            except Exception as e:
+                print(f"⚠️ WARNING: Could not fetch Lidarr release groups: {e}")
+                print("    Using ledger data only...")
+                lidarr_rg_count = rg_stats["total"]
     
+    return lidarr_artist_count, lidarr_rg_count
+
+
+@_buffered_output()
+def _print_report_sections(cfg: dict, show_canary_stats: bool, storage, artist_stats: Dict[str, any],
+                           rg_stats: Dict[str, any], lidarr_artist_count: int, lidarr_rg_count: int):
+    """Print every report section after the Lidarr fetch"""
     print()
     
     # Artist statistics
-    artist_stats = analyze_artists_stats(artists_ledger, cfg.get("cache_recheck_hours", 72))
     print("🎤 ARTIST MBID STATISTICS:")
     print(f"   Total artists in Lidarr: {lidarr_artist_count:,}")
     print(f"   Artists in ledger: {artist_stats['total']:,}")
@@ -885,7 +1199,6 @@ def print_stats_report(cfg: dict, show_canary_stats: bool = False):
     
     # Release group statistics (if enabled)
     if cfg.get("process_release_groups", False):
-        rg_stats = analyze_release_groups_stats(rg_ledger, cfg.get("cache_recheck_hours", 72))
         print("💿 RELEASE GROUP STATISTICS:")
         print(f"   Total release groups in Lidarr: {lidarr_rg_count:,}")
         print(f"   Release groups in ledger: {rg_stats['total']:,}")
@@ -948,11 +1261,10 @@ def print_stats_report(cfg: dict, show_canary_stats: bool = False):
     
     # Unicode processing check
     if cfg.get('artist_textsearch_transliterate_unicode', True):
-        try:
-            from unidecode import unidecode
+        if UNIDECODE_AVAILABLE:
             print("🌐 UNICODE SUPPORT: Enabled (unidecode available)")
             print("   International artists will be transliterated for better search results")
-        except ImportError:
+        else:
             print("⚠️ UNICODE SUPPORT: Enabled but unidecode missing!")
             print("   Install with: pip install unidecode")
             print("   Falling back to basic normalization (may not work well)")
@@ -972,42 +1284,55 @@ def print_stats_report(cfg: dict, show_canary_stats: bool = False):
     # Next steps recommendations
     print("🚀 RECOMMENDATIONS:")
     
-    if artist_stats['pending'] > 0:
-        print(f"   • Run cache warmer to process {artist_stats['pending']:,} pending artists")
+    # Bind the counters used below once
+    pending = artist_stats['pending']
+    ts_pending = artist_stats['text_search_pending']
+    stale_mbid = artist_stats['stale_mbid_cache']
+    stale_ts = artist_stats['stale_text_search']
+    recheck = artist_stats['recheck_enabled']
+    success_rate = artist_stats['success_rate']
+    rg_pending = rg_stats.get('pending', 0)
+    rg_stale = rg_stats.get('stale_entries', 0)
+    rg_recheck = rg_stats.get('recheck_enabled', False)
+    process_ts = cfg.get("process_artist_textsearch")
+    process_rgs = cfg.get("process_release_groups")
+    
+    if pending > 0:
+        print(f"   • Run cache warmer to process {pending:,} pending artists")
     
-    if cfg.get("process_artist_textsearch") and artist_stats['text_search_pending'] > 0:
-        print(f"   • Process {artist_stats['text_search_pending']:,} pending text searches")
+    if process_ts and ts_pending > 0:
+        print(f"   • Process {ts_pending:,} pending text searches")
     
-    if cfg.get("process_release_groups") and rg_stats.get('pending', 0) > 0:
-        eligible_pending = min(rg_stats['pending'], rg_stats['eligible_for_processing'])
+    if process_rgs and rg_pending > 0:
+        eligible_pending = min(rg_pending, rg_stats['eligible_for_processing'])
         if eligible_pending > 0:
             print(f"   • Process {eligible_pending:,} eligible release groups")
     
-    if artist_stats['success_rate'] > 90 and not cfg.get("process_release_groups"):
+    if success_rate > 90 and not process_rgs:
         print("   • Consider enabling release group processing: process_release_groups = true")
     
-    if not cfg.get("process_artist_textsearch") and artist_stats['success_rate'] > 80:
+    if not process_ts and success_rate > 80:
         print("   • Consider enabling text search warming: process_artist_textsearch = true")
     
     if total_entities > 1000 and storage_type == "csv":
         print("   • Switch to SQLite for better performance: storage_type = sqlite")
     
     # Show stale entries recommendations
-    if artist_stats['recheck_enabled']:
-        if artist_stats['stale_mbid_cache'] > 0:
-            print(f"   • Process {artist_stats['stale_mbid_cache']:,} stale MBID cache entries")
-        if artist_stats['stale_text_search'] > 0:
-            print(f"   • Process {artist_stats['stale_text_search']:,} stale text search entries")
-        if cfg.get("process_release_groups") and rg_stats.get('stale_entries', 0) > 0:
-            print(f"   • Process {rg_stats['stale_entries']:,} stale release group entries")
+    if recheck:
+        if stale_mbid > 0:
+            print(f"   • Process {stale_mbid:,} stale MBID cache entries")
+        if stale_ts > 0:
+            print(f"   • Process {stale_ts:,} stale text search entries")
+        if process_rgs and rg_stale > 0:
+            print(f"   • Process {rg_stale:,} stale release group entries")
     
     # Show phase processing order
     phases_enabled = []
-    if artist_stats['pending'] > 0 or (artist_stats['recheck_enabled'] and artist_stats['stale_mbid_cache'] > 0):
+    if pending > 0 or (recheck and stale_mbid > 0):
         phases_enabled.append("Phase 1: Artist MBID warming")
-    if cfg.get("process_artist_textsearch") and (artist_stats['text_search_pending'] > 0 or (artist_stats['recheck_enabled'] and artist_stats['stale_text_search'] > 0)):
+    if process_ts and (ts_pending > 0 or (recheck and stale_ts > 0)):
         phases_enabled.append("Phase 2: Text search warming")  
-    if cfg.get("process_release_groups") and (rg_stats.get('pending', 0) > 0 or (rg_stats['recheck_enabled'] and rg_stats.get('stale_entries', 0) > 0)):
+    if process_rgs and (rg_pending > 0 or (rg_recheck and rg_stale > 0)):
         phases_enabled.append("Phase 3: Release group warming")
     
     if phases_enabled:
@@ -1033,13 +1358,12 @@ def main():
     args = parser.parse_args()
 
     try:
-        cfg = load_config(args.config)
+        cfg, config_issues = load_config_with_issues(args.config)
     except Exception as e:
         print(f"ERROR loading config: {e}", file=sys.stderr)
         sys.exit(2)
 
-    # Validate configuration
-    config_issues = validate_config(cfg)
+    # Report configuration issues found while loading
     if config_issues:
         print("Configuration issues found:", file=sys.stderr)
         for issue in config_issues:
@@ -1085,13 +1409,14 @@ def main():
         print("   Continuing with limited CSV analysis...", file=sys.stderr)
         print("=" * 60, file=sys.stderr)
 
-    print_stats_report(cfg, args.canary_stats)
+    storage = print_stats_report(cfg, args.canary_stats)
     
     # Show CF cache analysis if requested
     if args.cf_cache_stats:
-        # Create storage backend to access CF cache data
+        # Reuse the report's storage backend (and its open connection) when it has one
         try:
-            storage = create_storage_backend(cfg)
+            if storage is None:
+                storage = create_storage_backend(cfg)
             print_cf_cache_analysis(storage)
         except Exception as e:
             print(f"❌ Error accessing storage for CF cache analysis: {e}", file=sys.stderr)
@@ -1,20 +1,151 @@
 #!/usr/bin/env python3
+import atexit
 import csv
+import mmap
 import os
 import sqlite3
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Dict, List
+from collections import Counter, deque
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+def normalize_status(value: str) -> str:
+    """Lowercase and intern a status value once at ledger load time"""
+    return sys.intern((value or "").lower().strip())
+
+
+CSV_WRITE_BUFFER = 1 << 20  # 1MB: ledger rewrites hit the disk in a handful of write() calls
+# Decorated-row accessors for the ledger writers
+_SORT_PREFIX_2 = itemgetter(0, 1)
+_SORT_PREFIX_3 = itemgetter(0, 1, 2)
+_TRUTHY = frozenset(("true", "1"))  # CSV spellings of a true boolean
+
+# CSV column order as read by the ledger loaders
+_ARTIST_CSV_COLUMNS = ("mbid", "artist_name", "status", "attempts", "last_status_code", "last_checked",
+                       "text_search_attempted", "text_search_success", "text_search_last_checked",
+                       "manual_entry", "last_canary_target", "last_cf_cache_status")
+_RG_CSV_COLUMNS = ("rg_mbid", "rg_title", "artist_mbid", "artist_name", "artist_cache_status",
+                   "status", "attempts", "last_status_code", "last_checked", "manual_entry",
+                   "last_canary_target", "last_cf_cache_status")
+
+
+@contextmanager
+def _mapped_lines(path: str) -> Iterator[Iterator[str]]:
+    """Memory-map a UTF-8 file and yield an iterator over its lines, line endings kept for csv"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield iter(())  # mmap refuses empty files
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield map(bytes.decode, iter(mm.readline, b""))
+
+
+def _file_signature(path: str):
+    """(inode, mtime, size) of a file, or None when missing; atomic rewrites always change the inode"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _csv_rows(lines, columns: Tuple[str, ...]) -> Iterator[Tuple[str, ...]]:
+    """Yield each CSV row as a tuple of `columns`, resolved by header position once ("" when absent)"""
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    width = len(header)
+    positions = {name: i for i, name in enumerate(header)}
+    # Absent columns point at the "" sentinel appended to every row
+    get: Callable = itemgetter(*(positions.get(name, -1) for name in columns))
+    for row in reader:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))  # Short rows: missing trailing cells read as ""
+        row.append("")
+        yield get(row)
+
+
+def _julian_now() -> float:
+    """Current time as a SQLite julian day number"""
+    return time.time() / 86400.0 + 2440587.5
+
+
+_iso_second = (0, "")  # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS"), swapped as one tuple
 
 
 def iso_now() -> str:
     """Generate ISO timestamp for current UTC time"""
-    return datetime.now(timezone.utc).isoformat()
+    global _iso_second
+    now = time.time()
+    second = int(now)
+    cached, prefix = _iso_second
+    if second != cached:
+        # strftime only once per wall-clock second; the record paths call this per response
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second = (second, prefix)
+    micros = int((now - second) * 1000000)
+    # Same shape as datetime.isoformat(), which drops a zero fraction
+    return f"{prefix}.{micros:06d}+00:00" if micros else prefix + "+00:00"
+
+
+class Ledger(dict):
+    """Ledger dict that also buckets rows by status as they are loaded"""
+    
+    def __init__(self):
+        super().__init__()
+        # Reflect the rows as loaded; later in-place status edits aren't tracked
+        self.success_rows: List[Dict] = []
+        self.timeout_rows: List[Dict] = []
+    
+    def _bucket_for(self, row: Dict):
+        status = row.get("status", "")
+        if status == "success":
+            return self.success_rows
+        if status == "timeout":
+            return self.timeout_rows
+        return None
+    
+    def add(self, key: str, row: Dict) -> None:
+        """Store a loaded row and file it under its status bucket"""
+        previous = self.get(key)
+        if previous is not None:
+            bucket = self._bucket_for(previous)
+            if bucket is not None:
+                bucket.remove(previous)
+        self[key] = row
+        bucket = self._bucket_for(row)
+        if bucket is not None:
+            bucket.append(row)
 
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends"""
     
+    # True when db_path is a SQLite database that can be queried directly
+    supports_sql = False
+    
+    def _cached_ledger(self, name: str, signature, load: Callable[[], Ledger]) -> Ledger:
+        """Return the parsed ledger `name`, re-parsing only when `signature` changes"""
+        # Readers share one Ledger (no per-read copy); in-place edits are expected to be
+        # written back, and every write drops the entry so the next read sees the store
+        cached = self._ledger_cache.get(name)
+        if cached is None or cached[0] != signature:
+            cached = (signature, load())
+            self._ledger_cache[name] = cached
+        return cached[1]
+    
+    def _forget_ledger(self, name: str) -> None:
+        """Drop the cached parse of ledger `name` once it has been written"""
+        self._ledger_cache.pop(name, None)
+    
     @abstractmethod
     def read_artists_ledger(self) -> Dict[str, Dict]:
         """Read artists ledger into a dict keyed by MBID"""
@@ -35,11 +166,27 @@ class StorageBackend(ABC):
         """Write release groups ledger from dict"""
         pass
     
+    def write_artists_rows(self, ledger: Dict[str, Dict], keys) -> None:
+        """Persist the given artist rows; backends without row-level writes rewrite the ledger"""
+        self.write_artists_ledger(ledger)
+    
+    def write_release_groups_rows(self, ledger: Dict[str, Dict], keys) -> None:
+        """Persist the given release group rows; backends without row-level writes rewrite the ledger"""
+        self.write_release_groups_ledger(ledger)
+    
+    def flush(self) -> None:
+        """Persist any buffered response analytics; backends that write synchronously have nothing to do"""
+        pass
+    
     @abstractmethod
     def exists(self) -> bool:
         """Check if storage exists (for first-run detection)"""
         pass
     
+    def is_initialized(self) -> bool:
+        """Check whether the cache warmer has created this store yet"""
+        return self.exists()
+    
     @abstractmethod
     def get_canary_statistics(self) -> Dict[str, Dict]:
         """Get canary response target statistics"""
@@ -57,96 +204,114 @@ class CSVStorage(StorageBackend):
     def __init__(self, artists_csv_path: str, release_groups_csv_path: str):
         self.artists_csv_path = artists_csv_path
         self.release_groups_csv_path = release_groups_csv_path
+        self._ledger_cache = {}  # name -> (file signature, parsed Ledger)
     
     def read_artists_ledger(self) -> Dict[str, Dict]:
         """Read existing artists CSV into a dict keyed by MBID."""
-        ledger: Dict[str, Dict] = {}
+        return self._cached_ledger("artists", _file_signature(self.artists_csv_path), self._parse_artists_csv)
+    
+    def _parse_artists_csv(self) -> Ledger:
+        """Parse the artists CSV into a Ledger"""
+        ledger = Ledger()
         if not os.path.exists(self.artists_csv_path):
             return ledger
         
-        with open(self.artists_csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                mbid = (row.get("mbid") or "").strip()
+        with _mapped_lines(self.artists_csv_path) as lines:
+            # Columns missing from older CSVs read as "" (backwards compatibility)
+            for (mbid, artist_name, status, attempts, last_status_code, last_checked,
+                 ts_attempted, ts_success, ts_last_checked,
+                 manual_entry, last_canary_target, last_cf_cache_status) in _csv_rows(lines, _ARTIST_CSV_COLUMNS):
+                mbid = mbid.strip()
                 if not mbid:
                     continue
-                ledger[mbid] = {
+                ledger.add(mbid, {
                     "mbid": mbid,
-                    "artist_name": row.get("artist_name", ""),
-                    "status": (row.get("status") or "").lower().strip(),
-                    "attempts": int((row.get("attempts") or "0") or 0),
-                    "last_status_code": row.get("last_status_code", ""),
-                    "last_checked": row.get("last_checked", ""),
-                    # Text search fields (with backwards compatibility)
-                    "text_search_attempted": row.get("text_search_attempted", "").lower() in ("true", "1"),
-                    "text_search_success": row.get("text_search_success", "").lower() in ("true", "1"),
-                    "text_search_last_checked": row.get("text_search_last_checked", ""),
-                    # Manual entry field (with backwards compatibility)
-                    "manual_entry": row.get("manual_entry", "").lower() in ("true", "1"),
-                    # Canary tracking (with backwards compatibility)
-                    "last_canary_target": row.get("last_canary_target", ""),
-                    # CF Cache Status tracking (with backwards compatibility)
-                    "last_cf_cache_status": row.get("last_cf_cache_status", ""),
-                }
+                    "artist_name": artist_name,
+                    "status": normalize_status(status),
+                    "attempts": int(attempts or 0),
+                    "last_status_code": last_status_code,
+                    "last_checked": last_checked,
+                    # Text search fields
+                    "text_search_attempted": ts_attempted.lower() in _TRUTHY,
+                    "text_search_success": ts_success.lower() in _TRUTHY,
+                    "text_search_last_checked": ts_last_checked,
+                    # Manual entry field
+                    "manual_entry": manual_entry.lower() in _TRUTHY,
+                    # Canary tracking
+                    "last_canary_target": last_canary_target,
+                    # CF Cache Status tracking
+                    "last_cf_cache_status": last_cf_cache_status,
+                })
         return ledger
 
     def write_artists_ledger(self, ledger: Dict[str, Dict]) -> None:
         """Write the artists ledger dict back to CSV atomically."""
+        self._forget_ledger("artists")
         os.makedirs(os.path.dirname(self.artists_csv_path) or ".", exist_ok=True)
-        fieldnames = ["mbid", "artist_name", "status", "attempts", "last_status_code", "last_checked",
-                      "text_search_attempted", "text_search_success", "text_search_last_checked", 
-                      "manual_entry", "last_canary_target", "last_cf_cache_status"]
+        fieldnames = _ARTIST_CSV_COLUMNS
         tmp_path = self.artists_csv_path + ".tmp"
-        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for _, row in sorted(ledger.items(), key=lambda kv: (kv[1].get("artist_name", ""), kv[0])):
-                writer.writerow(row)
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            # Sort on pre-extracted (name, mbid) keys in C; the key prefix is unique per row
+            rows = [(row.get("artist_name", ""), mbid, row) for mbid, row in ledger.items()]
+            rows.sort(key=_SORT_PREFIX_2)
+            # Positional rows straight into the C writer; missing fields write as "" like DictWriter's restval
+            writer.writerows([row.get(name, "") for name in fieldnames] for *_, row in rows)
         os.replace(tmp_path, self.artists_csv_path)
 
     def read_release_groups_ledger(self) -> Dict[str, Dict]:
         """Read existing release groups CSV into a dict keyed by RG MBID."""
-        ledger: Dict[str, Dict] = {}
+        return self._cached_ledger("release_groups", _file_signature(self.release_groups_csv_path),
+                                   self._parse_release_groups_csv)
+    
+    def _parse_release_groups_csv(self) -> Ledger:
+        """Parse the release groups CSV into a Ledger"""
+        ledger = Ledger()
         if not os.path.exists(self.release_groups_csv_path):
             return ledger
         
-        with open(self.release_groups_csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                rg_mbid = (row.get("rg_mbid") or "").strip()
+        with _mapped_lines(self.release_groups_csv_path) as lines:
+            # Columns missing from older CSVs read as "" (backwards compatibility)
+            for (rg_mbid, rg_title, artist_mbid, artist_name, artist_cache_status,
+                 status, attempts, last_status_code, last_checked, manual_entry,
+                 last_canary_target, last_cf_cache_status) in _csv_rows(lines, _RG_CSV_COLUMNS):
+                rg_mbid = rg_mbid.strip()
                 if not rg_mbid:
                     continue
-                ledger[rg_mbid] = {
+                ledger.add(rg_mbid, {
                     "rg_mbid": rg_mbid,
-                    "rg_title": row.get("rg_title", ""),
-                    "artist_mbid": row.get("artist_mbid", ""),
-                    "artist_name": row.get("artist_name", ""),
-                    "artist_cache_status": row.get("artist_cache_status", ""),
-                    "status": (row.get("status") or "").lower().strip(),
-                    "attempts": int((row.get("attempts") or "0") or 0),
-                    "last_status_code": row.get("last_status_code", ""),
-                    "last_checked": row.get("last_checked", ""),
-                    # Manual entry field (with backwards compatibility)
-                    "manual_entry": row.get("manual_entry", "").lower() in ("true", "1"),
-                    # Canary tracking (with backwards compatibility)
-                    "last_canary_target": row.get("last_canary_target", ""),
-                    # CF Cache Status tracking (with backwards compatibility)
-                    "last_cf_cache_status": row.get("last_cf_cache_status", ""),
-                }
+                    "rg_title": rg_title,
+                    "artist_mbid": artist_mbid,
+                    "artist_name": artist_name,
+                    "artist_cache_status": normalize_status(artist_cache_status),
+                    "status": normalize_status(status),
+                    "attempts": int(attempts or 0),
+                    "last_status_code": last_status_code,
+                    "last_checked": last_checked,
+                    # Manual entry field
+                    "manual_entry": manual_entry.lower() in _TRUTHY,
+                    # Canary tracking
+                    "last_canary_target": last_canary_target,
+                    # CF Cache Status tracking
+                    "last_cf_cache_status": last_cf_cache_status,
+                })
         return ledger
 
     def write_release_groups_ledger(self, ledger: Dict[str, Dict]) -> None:
         """Write the release groups ledger dict back to CSV atomically."""
+        self._forget_ledger("release_groups")
         os.makedirs(os.path.dirname(self.release_groups_csv_path) or ".", exist_ok=True)
-        fieldnames = ["rg_mbid", "rg_title", "artist_mbid", "artist_name", "artist_cache_status", 
-                      "status", "attempts", "last_status_code", "last_checked", "manual_entry",
-                      "last_canary_target", "last_cf_cache_status"]
+        fieldnames = _RG_CSV_COLUMNS
         tmp_path = self.release_groups_csv_path + ".tmp"
-        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for _, row in sorted(ledger.items(), key=lambda kv: (kv[1].get("artist_name", ""), kv[1].get("rg_title", ""), kv[0])):
-                writer.writerow(row)
+        with open(tmp_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            # Sort on pre-extracted (name, title, mbid) keys in C; the key prefix is unique per row
+            rows = [(row.get("artist_name", ""), row.get("rg_title", ""), rg_mbid, row) for rg_mbid, row in ledger.items()]
+            rows.sort(key=_SORT_PREFIX_3)
+            # Positional rows straight into the C writer; missing fields write as "" like DictWriter's restval
+            writer.writerows([row.get(name, "") for name in fieldnames] for *_, row in rows)
         os.replace(tmp_path, self.release_groups_csv_path)
 
     def exists(self) -> bool:
@@ -159,30 +324,25 @@ class CSVStorage(StorageBackend):
         artists_ledger = self.read_artists_ledger()
         rg_ledger = self.read_release_groups_ledger()
         
-        canary_stats = {}
-        
-        # Count current canary targets from ledgers
-        for artist in artists_ledger.values():
-            target = artist.get("last_canary_target", "")
-            if target:
-                if target not in canary_stats:
-                    canary_stats[target] = {"artist_success": 0, "artist_total": 0, "rg_success": 0, "rg_total": 0, "text_search_success": 0, "text_search_total": 0}
-                canary_stats[target]["artist_total"] += 1
-                if artist.get("status", "").lower() == "success":
-                    canary_stats[target]["artist_success"] += 1
-                if artist.get("text_search_attempted", False):
-                    canary_stats[target]["text_search_total"] += 1
-                    if artist.get("text_search_success", False):
-                        canary_stats[target]["text_search_success"] += 1
+        # Tally each column with a C-level Counter pass; the Ledger already buckets success rows
+        artist_total = Counter(a.get("last_canary_target", "") for a in artists_ledger.values())
+        artist_success = Counter(a.get("last_canary_target", "") for a in artists_ledger.success_rows)
+        ts_total = Counter(a.get("last_canary_target", "") for a in artists_ledger.values()
+                           if a.get("text_search_attempted", False))
+        ts_success = Counter(a.get("last_canary_target", "") for a in artists_ledger.values()
+                             if a.get("text_search_attempted", False) and a.get("text_search_success", False))
+        rg_total = Counter(rg.get("last_canary_target", "") for rg in rg_ledger.values())
+        rg_success = Counter(rg.get("last_canary_target", "") for rg in rg_ledger.success_rows)
         
-        for rg in rg_ledger.values():
-            target = rg.get("last_canary_target", "")
-            if target:
-                if target not in canary_stats:
-                    canary_stats[target] = {"artist_success": 0, "artist_total": 0, "rg_success": 0, "rg_total": 0, "text_search_success": 0, "text_search_total": 0}
-                canary_stats[target]["rg_total"] += 1
-                if rg.get("status", "").lower() == "success":
-                    canary_stats[target]["rg_success"] += 1
+        # Targets in first-seen order: artists, then release groups
+        canary_stats = {}
+        for target in chain(artist_total, rg_total):
+            if target and target not in canary_stats:
+                canary_stats[target] = {
+                    "artist_success": artist_success[target], "artist_total": artist_total[target],
+                    "rg_success": rg_success[target], "rg_total": rg_total[target],
+                    "text_search_success": ts_success[target], "text_search_total": ts_total[target],
+                }
         
         return canary_stats
     
@@ -212,138 +372,113 @@ class CSVStorage(StorageBackend):
         return {"basic_counts": cf_stats}
 
 
+def _rollup_deltas(rows: List[Tuple]) -> List[Tuple]:
+    """Fold queued response rows into (day, key, operation, status_code, total, success, first, last) tuples"""
+    deltas = {}
+    for timestamp, _, _, key, status_code, success, operation_type in rows:
+        bucket = (timestamp[:10], key, operation_type, status_code)
+        entry = deltas.get(bucket)
+        if entry is None:
+            deltas[bucket] = [1, success, timestamp, timestamp]
+        else:
+            entry[0] += 1
+            entry[1] += success
+            if timestamp < entry[2]:
+                entry[2] = timestamp
+            if timestamp > entry[3]:
+                entry[3] = timestamp
+    return [bucket + tuple(entry) for bucket, entry in deltas.items()]
+
+
+# Flag columns hold 0/1 (writers store int(bool)); anything else non-empty reads as True like bool() would
+sqlite3.register_converter("BOOL", lambda b: b not in (b"0", b""))
+
+
 class SQLiteStorage(StorageBackend):
     """SQLite database storage backend"""
     
-    def __init__(self, db_path: str):
+    supports_sql = True  # _init_db creates the database at construction
+    SCHEMA_VERSION = 4  # Bump and extend _migrate_schema when the table layout changes
+    
+    def __init__(self, db_path: str, response_retention_days: int = 0):
         self.db_path = db_path
+        self.response_retention_days = response_retention_days  # 0 keeps raw responses forever
+        self._read_conn = None
+        self._read_lock = threading.RLock()
+        self._ledger_cache = {}  # name -> (PRAGMA data_version, parsed Ledger)
+        self._existed_at_open = os.path.exists(db_path)  # _init_db creates the file
         self._init_db()
+        # One long-lived writer connection; the lock serializes it across threads
+        self._conn = self._connect()
+        self._write_lock = threading.Lock()
+        # Response analytics are queued and group-committed by a background flusher
+        self._canary_queue = deque(maxlen=self.RESPONSE_QUEUE_LIMIT)
+        self._cf_queue = deque(maxlen=self.RESPONSE_QUEUE_LIMIT)
+        self._flush_wakeup = threading.Event()
+        self._flusher = None
+        self._dropped_responses = 0
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a read/write connection with the standard PRAGMA setup"""
+        # IMMEDIATE: implicit transactions take the write lock up front instead of failing mid-way with SQLITE_BUSY
+        conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level="IMMEDIATE", check_same_thread=False)
+        conn.execute("PRAGMA synchronous = NORMAL")  # Safe with WAL; fsync at checkpoints only
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA cache_size = -20000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Shared read-only connection for analytics queries, opened on first use and held under the read lock"""
+        if self._canary_queue or self._cf_queue:
+            self.flush()  # Analytics must see this process's queued responses
+        with self._read_lock:
+            if self._read_conn is None:
+                uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+                # PARSE_COLNAMES: `AS "col [BOOL]"` aliases decode 0/1 flags in C.
+                # Worker and flusher threads share the reader too; _read_lock serializes its use
+                conn = sqlite3.connect(uri, uri=True, timeout=5.0, detect_types=sqlite3.PARSE_COLNAMES,
+                                       check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                # Read-heavy, short-lived: bigger page cache, mmap reads, in-memory temp sorts
+                conn.execute("PRAGMA cache_size = -65536")
+                conn.execute("PRAGMA mmap_size = 268435456")
+                conn.execute("PRAGMA temp_store = MEMORY")
+                self._read_conn = conn
+            yield self._read_conn
+    
+    @staticmethod
+    def _exec_tuples(conn: sqlite3.Connection, sql: str, params=()) -> sqlite3.Cursor:
+        """Execute on conn with rows coming back as plain tuples for positional unpacking"""
+        cursor = conn.cursor()
+        cursor.row_factory = None  # Skip building a sqlite3.Row per result row
+        return cursor.execute(sql, params)
+    
+    def query(self, sql: str, params=()) -> List[sqlite3.Row]:
+        """Run a read-only query on the shared analytics connection"""
+        with self._read_connection() as conn:
+            return conn.execute(sql, params).fetchall()
     
     def _init_db(self):
         """Initialize SQLite database with tables and handle migrations"""
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Create tables with basic structure first
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS artists (
-                    mbid TEXT PRIMARY KEY,
-                    artist_name TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT '',
-                    attempts INTEGER NOT NULL DEFAULT 0,
-                    last_status_code TEXT NOT NULL DEFAULT '',
-                    last_checked TEXT NOT NULL DEFAULT ''
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS release_groups (
-                    rg_mbid TEXT PRIMARY KEY,
-                    rg_title TEXT NOT NULL,
-                    artist_mbid TEXT NOT NULL,
-                    artist_name TEXT NOT NULL,
-                    artist_cache_status TEXT NOT NULL DEFAULT '',
-                    status TEXT NOT NULL DEFAULT '',
-                    attempts INTEGER NOT NULL DEFAULT 0,
-                    last_status_code TEXT NOT NULL DEFAULT '',
-                    last_checked TEXT NOT NULL DEFAULT '',
-                    FOREIGN KEY (artist_mbid) REFERENCES artists (mbid)
-                )
-            """)
-            
-            # Create canary tracking table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS canary_responses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    entity_type TEXT NOT NULL,
-                    entity_id TEXT NOT NULL,
-                    canary_target TEXT NOT NULL,
-                    status_code TEXT NOT NULL,
-                    success INTEGER NOT NULL,
-                    operation_type TEXT NOT NULL DEFAULT 'mbid_check'
-                )
-            """)
-            
-            # Create CF cache status tracking table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cf_cache_responses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    entity_type TEXT NOT NULL,
-                    entity_id TEXT NOT NULL,
-                    cf_cache_status TEXT NOT NULL,
-                    status_code TEXT NOT NULL,
-                    success INTEGER NOT NULL,
-                    operation_type TEXT NOT NULL DEFAULT 'mbid_check'
-                )
-            """)
-            
-            # Add text search columns if they don't exist (migration)
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN text_search_attempted INTEGER NOT NULL DEFAULT 0")
-                print("Added text_search_attempted column to artists table")
-            except sqlite3.OperationalError:
-                pass
-            
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN text_search_success INTEGER NOT NULL DEFAULT 0")
-                print("Added text_search_success column to artists table")
-            except sqlite3.OperationalError:
-                pass
-            
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN text_search_last_checked TEXT NOT NULL DEFAULT ''")
-                print("Added text_search_last_checked column to artists table")
-            except sqlite3.OperationalError:
-                pass
-            
-            # Add manual_entry columns if they don't exist (migration)
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN manual_entry INTEGER NOT NULL DEFAULT 0")
-                print("Added manual_entry column to artists table")
-            except sqlite3.OperationalError:
-                pass
-            
-            try:
-                conn.execute("ALTER TABLE release_groups ADD COLUMN manual_entry INTEGER NOT NULL DEFAULT 0")
-                print("Added manual_entry column to release_groups table")
-            except sqlite3.OperationalError:
-                pass
-            
-            # Add canary tracking columns if they don't exist (migration)
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN last_canary_target TEXT NOT NULL DEFAULT ''")
-                print("Added last_canary_target column to artists table")
-            except sqlite3.OperationalError:
-                pass
+        with self._connect() as conn:
+            # WAL is persistent: readers stop blocking writers for every later connection
+            conn.execute("PRAGMA journal_mode = WAL")
             
-            try:
-                conn.execute("ALTER TABLE release_groups ADD COLUMN last_canary_target TEXT NOT NULL DEFAULT ''")
-                print("Added last_canary_target column to release_groups table")
-            except sqlite3.OperationalError:
-                pass
-            
-            # Add CF cache status tracking columns if they don't exist (migration)
-            try:
-                conn.execute("ALTER TABLE artists ADD COLUMN last_cf_cache_status TEXT NOT NULL DEFAULT ''")
-                print("Added last_cf_cache_status column to artists table")
-            except sqlite3.OperationalError:
-                pass
-            
-            try:
-                conn.execute("ALTER TABLE release_groups ADD COLUMN last_cf_cache_status TEXT NOT NULL DEFAULT ''")
-                print("Added last_cf_cache_status column to release_groups table")
-            except sqlite3.OperationalError:
-                pass
+            # Tables and column migrations only run when the file predates SCHEMA_VERSION
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self._migrate_schema(conn)
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
             
             # Create indexes for performance (only after columns exist)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_status ON artists (status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_text_search ON artists (text_search_attempted, text_search_success)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_manual ON artists (manual_entry)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_canary ON artists (last_canary_target)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_cf_cache ON artists (last_cf_cache_status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_rg_status ON release_groups (status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_rg_artist_status ON release_groups (artist_cache_status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_rg_artist_mbid ON release_groups (artist_mbid)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_rg_manual ON release_groups (manual_entry)")
@@ -355,132 +490,334 @@ class SQLiteStorage(StorageBackend):
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cf_cache_status ON cf_cache_responses (cf_cache_status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cf_cache_entity ON cf_cache_responses (entity_type, entity_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cf_cache_timestamp ON cf_cache_responses (timestamp)")
+            # Match the ledger readers' ORDER BY so rows come back in index order without a sort
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_by_name ON artists (artist_name, mbid)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_rg_by_name ON release_groups (artist_name, rg_title, rg_mbid)")
             
             conn.commit()
 
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Create tables and add any columns missing from older databases"""
+        # Create tables with basic structure first
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS artists (
+                mbid TEXT PRIMARY KEY,
+                artist_name TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT '',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_status_code TEXT NOT NULL DEFAULT '',
+                last_checked TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS release_groups (
+                rg_mbid TEXT PRIMARY KEY,
+                rg_title TEXT NOT NULL,
+                artist_mbid TEXT NOT NULL,
+                artist_name TEXT NOT NULL,
+                artist_cache_status TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL DEFAULT '',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_status_code TEXT NOT NULL DEFAULT '',
+                last_checked TEXT NOT NULL DEFAULT '',
+                FOREIGN KEY (artist_mbid) REFERENCES artists (mbid)
+            )
+        """)
+        
+        # Create canary tracking table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS canary_responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                canary_target TEXT NOT NULL,
+                status_code TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                operation_type TEXT NOT NULL DEFAULT 'mbid_check'
+            )
+        """)
+        
+        # Create CF cache status tracking table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cf_cache_responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                cf_cache_status TEXT NOT NULL,
+                status_code TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                operation_type TEXT NOT NULL DEFAULT 'mbid_check'
+            )
+        """)
+        
+        # Add text search columns if they don't exist (migration)
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN text_search_attempted INTEGER NOT NULL DEFAULT 0")
+            print("Added text_search_attempted column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN text_search_success INTEGER NOT NULL DEFAULT 0")
+            print("Added text_search_success column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN text_search_last_checked TEXT NOT NULL DEFAULT ''")
+            print("Added text_search_last_checked column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Add manual_entry columns if they don't exist (migration)
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN manual_entry INTEGER NOT NULL DEFAULT 0")
+            print("Added manual_entry column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        try:
+            conn.execute("ALTER TABLE release_groups ADD COLUMN manual_entry INTEGER NOT NULL DEFAULT 0")
+            print("Added manual_entry column to release_groups table")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Add canary tracking columns if they don't exist (migration)
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN last_canary_target TEXT NOT NULL DEFAULT ''")
+            print("Added last_canary_target column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        try:
+            conn.execute("ALTER TABLE release_groups ADD COLUMN last_canary_target TEXT NOT NULL DEFAULT ''")
+            print("Added last_canary_target column to release_groups table")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Add CF cache status tracking columns if they don't exist (migration)
+        try:
+            conn.execute("ALTER TABLE artists ADD COLUMN last_cf_cache_status TEXT NOT NULL DEFAULT ''")
+            print("Added last_cf_cache_status column to artists table")
+        except sqlite3.OperationalError:
+            pass
+        
+        try:
+            conn.execute("ALTER TABLE release_groups ADD COLUMN last_cf_cache_status TEXT NOT NULL DEFAULT ''")
+            print("Added last_cf_cache_status column to release_groups table")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Version 2: status columns are stored normalized so readers can use them as-is
+        conn.execute("UPDATE artists SET status = lower(trim(status)) WHERE status != lower(trim(status))")
+        conn.execute("""
+            UPDATE release_groups
+            SET status = lower(trim(status)), artist_cache_status = lower(trim(artist_cache_status))
+            WHERE status != lower(trim(status)) OR artist_cache_status != lower(trim(artist_cache_status))
+        """)
+        
+        # Version 3: no query reads the status indexes (pending rows are picked in Python), so stop maintaining them
+        conn.execute("DROP INDEX IF EXISTS idx_artists_status")
+        conn.execute("DROP INDEX IF EXISTS idx_rg_status")
+        
+        # Version 4: daily rollups of the response tables, kept current by flush(); the stats read these
+        for rollup, key_column, source in (("canary_rollup", "canary_target", "canary_responses"),
+                                           ("cf_cache_rollup", "cf_cache_status", "cf_cache_responses")):
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {rollup} (
+                    day TEXT NOT NULL,
+                    {key_column} TEXT NOT NULL,
+                    operation_type TEXT NOT NULL,
+                    status_code TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    success INTEGER NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    PRIMARY KEY (day, {key_column}, operation_type, status_code)
+                )
+            """)
+            if conn.execute(f"SELECT 1 FROM {rollup} LIMIT 1").fetchone() is None:
+                conn.execute(f"""
+                    INSERT INTO {rollup}
+                    SELECT substr(timestamp, 1, 10), {key_column}, operation_type, status_code,
+                           COUNT(*), SUM(success), MIN(timestamp), MAX(timestamp)
+                    FROM {source}
+                    GROUP BY 1, 2, 3, 4
+                """)
+
+    def _data_version(self) -> int:
+        """PRAGMA data_version of the reader; it changes whenever another connection commits"""
+        with self._read_connection() as conn:
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+    
     def read_artists_ledger(self) -> Dict[str, Dict]:
         """Read artists from SQLite into a dict keyed by MBID."""
-        ledger: Dict[str, Dict] = {}
+        return self._cached_ledger("artists", self._data_version(), self._query_artists_ledger)
+    
+    def _query_artists_ledger(self) -> Ledger:
+        """Load the artists table into a Ledger"""
+        ledger = Ledger()
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
+        with self._read_connection() as conn:
+            cursor = self._exec_tuples(conn, """
                 SELECT mbid, artist_name, status, attempts, last_status_code, last_checked,
-                       text_search_attempted, text_search_success, text_search_last_checked,
-                       manual_entry, last_canary_target, last_cf_cache_status
+                       text_search_attempted AS "text_search_attempted [BOOL]",
+                       text_search_success AS "text_search_success [BOOL]",
+                       text_search_last_checked,
+                       manual_entry AS "manual_entry [BOOL]",
+                       last_canary_target, last_cf_cache_status
                 FROM artists
                 ORDER BY artist_name, mbid
             """)
             
-            for row in cursor:
-                ledger[row["mbid"]] = {
-                    "mbid": row["mbid"],
-                    "artist_name": row["artist_name"],
-                    "status": row["status"].lower().strip(),
-                    "attempts": row["attempts"],
-                    "last_status_code": row["last_status_code"],
-                    "last_checked": row["last_checked"],
-                    "text_search_attempted": bool(row["text_search_attempted"]),
-                    "text_search_success": bool(row["text_search_success"]),
-                    "text_search_last_checked": row["text_search_last_checked"],
-                    "manual_entry": bool(row["manual_entry"]),
-                    "last_canary_target": row["last_canary_target"],
-                    "last_cf_cache_status": row["last_cf_cache_status"],
-                }
+            for (mbid, artist_name, status, attempts, last_status_code, last_checked,
+                 ts_attempted, ts_success, ts_last_checked,
+                 manual_entry, last_canary_target, last_cf_cache_status) in cursor:
+                ledger.add(mbid, {
+                    "mbid": mbid,
+                    "artist_name": artist_name,
+                    "status": sys.intern(status),  # Normalized on write
+                    "attempts": attempts,
+                    "last_status_code": last_status_code,
+                    "last_checked": last_checked,
+                    "text_search_attempted": ts_attempted,
+                    "text_search_success": ts_success,
+                    "text_search_last_checked": ts_last_checked,
+                    "manual_entry": manual_entry,
+                    "last_canary_target": last_canary_target,
+                    "last_cf_cache_status": last_cf_cache_status,
+                })
+        
         
         return ledger
 
     def write_artists_ledger(self, ledger: Dict[str, Dict]) -> None:
         """Write artists ledger to SQLite with upsert logic."""
-        with sqlite3.connect(self.db_path) as conn:
-            for mbid, data in ledger.items():
-                conn.execute("""
-                    INSERT OR REPLACE INTO artists 
-                    (mbid, artist_name, status, attempts, last_status_code, last_checked,
-                     text_search_attempted, text_search_success, text_search_last_checked, 
-                     manual_entry, last_canary_target, last_cf_cache_status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data["mbid"],
-                    data["artist_name"],
-                    data["status"],
-                    data["attempts"],
-                    data["last_status_code"],
-                    data["last_checked"],
-                    int(data.get("text_search_attempted", False)),
-                    int(data.get("text_search_success", False)),
-                    data.get("text_search_last_checked", ""),
-                    int(data.get("manual_entry", False)),
-                    data.get("last_canary_target", ""),
-                    data.get("last_cf_cache_status", "")
-                ))
+        self._upsert_artists(ledger.values())
+    
+    def write_artists_rows(self, ledger: Dict[str, Dict], keys) -> None:
+        """Upsert only the given artist MBIDs (rows touched since the last write)"""
+        self._upsert_artists(ledger[k] for k in dict.fromkeys(keys) if k in ledger)
+    
+    def _upsert_artists(self, entries) -> None:
+        """INSERT OR REPLACE the given artist row dicts"""
+        self._forget_ledger("artists")
+        rows = ((
+            data["mbid"],
+            data["artist_name"],
+            normalize_status(data["status"]),
+            data["attempts"],
+            data["last_status_code"],
+            data["last_checked"],
+            int(data.get("text_search_attempted", False)),
+            int(data.get("text_search_success", False)),
+            data.get("text_search_last_checked", ""),
+            int(data.get("manual_entry", False)),
+            data.get("last_canary_target", ""),
+            data.get("last_cf_cache_status", "")
+        ) for data in entries)
+        
+        # One prepared statement for every row, inside a single transaction
+        with self._write_lock, self._conn as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO artists 
+                (mbid, artist_name, status, attempts, last_status_code, last_checked,
+                 text_search_attempted, text_search_success, text_search_last_checked, 
+                 manual_entry, last_canary_target, last_cf_cache_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             conn.commit()
 
     def read_release_groups_ledger(self) -> Dict[str, Dict]:
         """Read release groups from SQLite into a dict keyed by RG MBID."""
-        ledger: Dict[str, Dict] = {}
+        return self._cached_ledger("release_groups", self._data_version(), self._query_release_groups_ledger)
+    
+    def _query_release_groups_ledger(self) -> Ledger:
+        """Load the release_groups table into a Ledger"""
+        ledger = Ledger()
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
+        with self._read_connection() as conn:
+            cursor = self._exec_tuples(conn, """
                 SELECT rg_mbid, rg_title, artist_mbid, artist_name, artist_cache_status,
-                       status, attempts, last_status_code, last_checked, manual_entry,
+                       status, attempts, last_status_code, last_checked,
+                       manual_entry AS "manual_entry [BOOL]",
                        last_canary_target, last_cf_cache_status
                 FROM release_groups
                 ORDER BY artist_name, rg_title, rg_mbid
             """)
             
-            for row in cursor:
-                ledger[row["rg_mbid"]] = {
-                    "rg_mbid": row["rg_mbid"],
-                    "rg_title": row["rg_title"],
-                    "artist_mbid": row["artist_mbid"],
-                    "artist_name": row["artist_name"],
-                    "artist_cache_status": row["artist_cache_status"],
-                    "status": row["status"].lower().strip(),
-                    "attempts": row["attempts"],
-                    "last_status_code": row["last_status_code"],
-                    "last_checked": row["last_checked"],
-                    "manual_entry": bool(row["manual_entry"]),
-                    "last_canary_target": row["last_canary_target"],
-                    "last_cf_cache_status": row["last_cf_cache_status"],
-                }
+            for (rg_mbid, rg_title, artist_mbid, artist_name, artist_cache_status,
+                 status, attempts, last_status_code, last_checked, manual_entry,
+                 last_canary_target, last_cf_cache_status) in cursor:
+                ledger.add(rg_mbid, {
+                    "rg_mbid": rg_mbid,
+                    "rg_title": rg_title,
+                    "artist_mbid": artist_mbid,
+                    "artist_name": artist_name,
+                    "artist_cache_status": sys.intern(artist_cache_status),  # Normalized on write
+                    "status": sys.intern(status),
+                    "attempts": attempts,
+                    "last_status_code": last_status_code,
+                    "last_checked": last_checked,
+                    "manual_entry": manual_entry,
+                    "last_canary_target": last_canary_target,
+                    "last_cf_cache_status": last_cf_cache_status,
+                })
+        
         
         return ledger
 
     def write_release_groups_ledger(self, ledger: Dict[str, Dict]) -> None:
         """Write release groups ledger to SQLite with upsert logic."""
-        with sqlite3.connect(self.db_path) as conn:
-            for rg_mbid, data in ledger.items():
-                conn.execute("""
-                    INSERT OR REPLACE INTO release_groups 
-                    (rg_mbid, rg_title, artist_mbid, artist_name, artist_cache_status,
-                     status, attempts, last_status_code, last_checked, manual_entry,
-                     last_canary_target, last_cf_cache_status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data["rg_mbid"],
-                    data["rg_title"],
-                    data["artist_mbid"],
-                    data["artist_name"],
-                    data["artist_cache_status"],
-                    data["status"],
-                    data["attempts"],
-                    data["last_status_code"],
-                    data["last_checked"],
-                    int(data.get("manual_entry", False)),
-                    data.get("last_canary_target", ""),
-                    data.get("last_cf_cache_status", "")
-                ))
+        self._upsert_release_groups(ledger.values())
+    
+    def write_release_groups_rows(self, ledger: Dict[str, Dict], keys) -> None:
+        """Upsert only the given release group MBIDs (rows touched since the last write)"""
+        self._upsert_release_groups(ledger[k] for k in dict.fromkeys(keys) if k in ledger)
+    
+    def _upsert_release_groups(self, entries) -> None:
+        """INSERT OR REPLACE the given release group row dicts"""
+        self._forget_ledger("release_groups")
+        rows = ((
+            data["rg_mbid"],
+            data["rg_title"],
+            data["artist_mbid"],
+            data["artist_name"],
+            normalize_status(data["artist_cache_status"]),
+            normalize_status(data["status"]),
+            data["attempts"],
+            data["last_status_code"],
+            data["last_checked"],
+            int(data.get("manual_entry", False)),
+            data.get("last_canary_target", ""),
+            data.get("last_cf_cache_status", "")
+        ) for data in entries)
+        
+        # One prepared statement for every row, inside a single transaction
+        with self._write_lock, self._conn as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO release_groups 
+                (rg_mbid, rg_title, artist_mbid, artist_name, artist_cache_status,
+                 status, attempts, last_status_code, last_checked, manual_entry,
+                 last_canary_target, last_cf_cache_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
             conn.commit()
 
+    def is_initialized(self) -> bool:
+        """Check if the database file existed before this backend opened it"""
+        return self._existed_at_open
+    
     def exists(self) -> bool:
         """Check if SQLite database exists and has data"""
         if not os.path.exists(self.db_path):
             return False
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write_lock, self._conn as conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM artists")
                 return cursor.fetchone()[0] > 0
         except sqlite3.Error:
@@ -488,82 +825,190 @@ class SQLiteStorage(StorageBackend):
 
     def update_release_groups_artist_status(self, artists_ledger: Dict[str, Dict]) -> None:
         """Efficiently update artist_cache_status in release groups based on current artist statuses"""
-        with sqlite3.connect(self.db_path) as conn:
-            for artist_mbid, artist_data in artists_ledger.items():
-                conn.execute("""
-                    UPDATE release_groups 
-                    SET artist_cache_status = ?
-                    WHERE artist_mbid = ?
-                """, (artist_data.get("status", ""), artist_mbid))
+        self._forget_ledger("release_groups")
+        with self._write_lock, self._conn as conn:
+            # Stage the statuses in a temp table, then apply them with one UPDATE that skips unchanged rows
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_artist_status (mbid TEXT PRIMARY KEY, status TEXT NOT NULL)")
+            conn.execute("DELETE FROM tmp_artist_status")
+            conn.executemany("INSERT INTO tmp_artist_status (mbid, status) VALUES (?, ?)",
+                             ((artist_mbid, normalize_status(artist_data.get("status", "")))
+                              for artist_mbid, artist_data in artists_ledger.items()))
+            conn.execute("""
+                UPDATE release_groups
+                SET artist_cache_status = (SELECT status FROM tmp_artist_status WHERE mbid = release_groups.artist_mbid)
+                WHERE artist_mbid IN (SELECT mbid FROM tmp_artist_status)
+                  AND artist_cache_status != (SELECT status FROM tmp_artist_status WHERE mbid = release_groups.artist_mbid)
+            """)
+            conn.execute("DELETE FROM tmp_artist_status")
             conn.commit()
     
+    # Response queues: flushed every RESPONSE_FLUSH_ROWS rows or RESPONSE_FLUSH_SECONDS, whichever comes first
+    RESPONSE_FLUSH_ROWS = 500
+    RESPONSE_FLUSH_SECONDS = 0.5
+    # While flushes keep failing: retry with doubling delays, and keep at most this many rows per queue
+    RESPONSE_FLUSH_MAX_BACKOFF = 60.0
+    RESPONSE_QUEUE_LIMIT = 50000
+    
+    def _drop_responses(self, count: int) -> None:
+        """Account for queued rows lost to RESPONSE_QUEUE_LIMIT, warning only on the first loss"""
+        if not self._dropped_responses:
+            print(f"WARNING: Response analytics queue is full ({self.RESPONSE_QUEUE_LIMIT:,} rows); "
+                  f"dropping the oldest rows until the database accepts writes again", file=sys.stderr)
+        self._dropped_responses += count
+    
+    def _queue_response(self, queue: deque, row: Tuple) -> None:
+        """Append a response row and make sure the flusher is running"""
+        if len(queue) == self.RESPONSE_QUEUE_LIMIT:
+            self._drop_responses(1)  # the bounded deque discards its oldest row on append
+        queue.append(row)  # deque.append is thread-safe
+        if self._flusher is None:
+            with self._write_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name="sqlite-response-flusher", daemon=True)
+                    self._flusher.start()
+                    atexit.register(self.flush)
+        if len(queue) >= self.RESPONSE_FLUSH_ROWS:
+            self._flush_wakeup.set()
+    
+    def _flush_loop(self) -> None:
+        """Background loop that drains the response queues"""
+        delay = self.RESPONSE_FLUSH_SECONDS
+        while True:
+            if delay > self.RESPONSE_FLUSH_SECONDS:
+                time.sleep(delay)  # backing off: full-queue wakeups must not turn retries into a busy loop
+            else:
+                self._flush_wakeup.wait(delay)
+            self._flush_wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                if delay == self.RESPONSE_FLUSH_SECONDS:
+                    print(f"WARNING: Failed to flush response analytics, retrying with backoff: {e}", file=sys.stderr)
+                delay = min(delay * 2, self.RESPONSE_FLUSH_MAX_BACKOFF)
+            else:
+                delay = self.RESPONSE_FLUSH_SECONDS
+    
+    def flush(self) -> None:
+        """Write all queued canary and CF cache responses in one transaction"""
+        with self._write_lock:
+            canary_rows = [self._canary_queue.popleft() for _ in range(len(self._canary_queue))]
+            cf_rows = [self._cf_queue.popleft() for _ in range(len(self._cf_queue))]
+            if not canary_rows and not cf_rows:
+                return
+            try:
+                with self._conn as conn:
+                    if canary_rows:
+                        conn.executemany("""
+                            INSERT INTO canary_responses 
+                            (timestamp, entity_type, entity_id, canary_target, status_code, success, operation_type)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """, canary_rows)
+                    if cf_rows:
+                        conn.executemany("""
+                            INSERT INTO cf_cache_responses 
+                            (timestamp, entity_type, entity_id, cf_cache_status, status_code, success, operation_type)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """, cf_rows)
+                    # Fold the batch into the daily rollups in the same transaction
+                    for rollup, key_column, rows in (("canary_rollup", "canary_target", canary_rows),
+                                                     ("cf_cache_rollup", "cf_cache_status", cf_rows)):
+                        if rows:
+                            conn.executemany(f"""
+                                INSERT INTO {rollup}
+                                (day, {key_column}, operation_type, status_code, total, success, first_seen, last_seen)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                                ON CONFLICT (day, {key_column}, operation_type, status_code) DO UPDATE SET
+                                    total = total + excluded.total,
+                                    success = success + excluded.success,
+                                    first_seen = min(first_seen, excluded.first_seen),
+                                    last_seen = max(last_seen, excluded.last_seen)
+                            """, _rollup_deltas(rows))
+            except Exception:
+                # Put the batch back in front of anything queued meanwhile so a later flush retries it;
+                # past RESPONSE_QUEUE_LIMIT the oldest rows of the batch are dropped
+                for queue, rows in ((self._canary_queue, canary_rows), (self._cf_queue, cf_rows)):
+                    overflow = len(queue) + len(rows) - self.RESPONSE_QUEUE_LIMIT
+                    if overflow > 0:
+                        self._drop_responses(overflow)
+                        rows = rows[overflow:]
+                    queue.extendleft(reversed(rows))
+                raise
+    
+    def prune_responses(self) -> int:
+        """Delete raw responses older than response_retention_days; the rollups keep their totals"""
+        if self.response_retention_days <= 0:
+            return 0
+        cutoff = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() - self.response_retention_days * 86400))
+        self.flush()
+        with self._write_lock, self._conn as conn:
+            deleted = conn.execute("DELETE FROM canary_responses WHERE timestamp < ?", (cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM cf_cache_responses WHERE timestamp < ?", (cutoff,)).rowcount
+        return deleted
+    
+    def analyze_if_needed(self) -> None:
+        """Gather planner statistics once the response tables have data (writer side only)"""
+        with self._write_lock, self._conn as conn:
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats and conn.execute("SELECT 1 FROM cf_cache_responses LIMIT 1").fetchone():
+                conn.execute("ANALYZE")
+    
     def record_canary_response(self, entity_type: str, entity_id: str, canary_target: str, 
                               status_code: str, success: bool, operation_type: str = "mbid_check") -> None:
-        """Record a canary response for analytics"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO canary_responses 
-                (timestamp, entity_type, entity_id, canary_target, status_code, success, operation_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (iso_now(), entity_type, entity_id, canary_target, status_code, int(success), operation_type))
-            conn.commit()
+        """Queue a canary response for analytics"""
+        self._queue_response(self._canary_queue,
+                             (iso_now(), entity_type, entity_id, canary_target, status_code, int(success), operation_type))
     
     def record_cf_cache_response(self, entity_type: str, entity_id: str, cf_cache_status: str, 
                                 status_code: str, success: bool, operation_type: str = "mbid_check") -> None:
-        """Record a CloudFlare cache status response for analytics"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO cf_cache_responses 
-                (timestamp, entity_type, entity_id, cf_cache_status, status_code, success, operation_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (iso_now(), entity_type, entity_id, cf_cache_status, status_code, int(success), operation_type))
-            conn.commit()
+        """Queue a CloudFlare cache status response for analytics"""
+        self._queue_response(self._cf_queue,
+                             (iso_now(), entity_type, entity_id, cf_cache_status, status_code, int(success), operation_type))
     
-    def get_canary_statistics(self) -> Dict[str, Dict]:
-        """Get comprehensive canary response target statistics"""
-        stats = {}
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Get stats grouped by canary target and operation type
-            cursor = conn.execute("""
+    def iter_canary_aggregates(self) -> Iterator[Tuple[str, str, int, int, str, str]]:
+        """Yield (target, operation_type, total, successes, first_seen, last_seen) per canary target/operation"""
+        with self._read_connection() as conn:
+            rows = conn.execute("""
                 SELECT 
                     canary_target,
                     operation_type,
-                    COUNT(*) as total_requests,
+                    SUM(total) as total_requests,
                     SUM(success) as successful_requests,
-                    MIN(timestamp) as first_seen,
-                    MAX(timestamp) as last_seen
-                FROM canary_responses 
+                    MIN(first_seen) as first_seen,
+                    MAX(last_seen) as last_seen
+                FROM canary_rollup 
                 WHERE canary_target != '' 
                 GROUP BY canary_target, operation_type
                 ORDER BY canary_target, operation_type
-            """)
-            
-            for row in cursor:
-                target = row["canary_target"]
-                op_type = row["operation_type"]
-                
-                if target not in stats:
-                    stats[target] = {
-                        "first_seen": row["first_seen"],
-                        "last_seen": row["last_seen"],
-                        "operations": {}
-                    }
-                
-                # Update first/last seen dates
-                if row["first_seen"] < stats[target]["first_seen"]:
-                    stats[target]["first_seen"] = row["first_seen"]
-                if row["last_seen"] > stats[target]["last_seen"]:
-                    stats[target]["last_seen"] = row["last_seen"]
-                
-                # Add operation stats
-                stats[target]["operations"][op_type] = {
-                    "total_requests": row["total_requests"],
-                    "successful_requests": row["successful_requests"],
-                    "success_rate": (row["successful_requests"] / row["total_requests"]) * 100 if row["total_requests"] > 0 else 0.0
+            """).fetchall()  # The rollup is small; don't hold the read lock across yields
+        yield from rows
+    
+    def get_canary_statistics(self) -> Dict[str, Dict]:
+        """Get comprehensive canary response target statistics"""
+        stats = {}
+        
+        # Stats grouped by canary target and operation type
+        for target, op_type, total_requests, successful_requests, first_seen, last_seen in self.iter_canary_aggregates():
+            if target not in stats:
+                stats[target] = {
+                    "first_seen": first_seen,
+                    "last_seen": last_seen,
+                    "operations": {}
                 }
+            
+            # Update first/last seen dates
+            if first_seen < stats[target]["first_seen"]:
+                stats[target]["first_seen"] = first_seen
+            if last_seen > stats[target]["last_seen"]:
+                stats[target]["last_seen"] = last_seen
+            
+            # Add operation stats
+            stats[target]["operations"][op_type] = {
+                "total_requests": total_requests,
+                "successful_requests": successful_requests,
+                "success_rate": (successful_requests / total_requests) * 100 if total_requests > 0 else 0.0
+            }
         
         return stats
     
@@ -571,69 +1016,132 @@ class SQLiteStorage(StorageBackend):
         """Get comprehensive CloudFlare cache status statistics"""
         stats = {}
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Get overall CF cache status distribution
-            cursor = conn.execute("""
-                SELECT 
-                    cf_cache_status,
-                    COUNT(*) as total_requests,
-                    SUM(success) as successful_requests,
-                    MIN(timestamp) as first_seen,
-                    MAX(timestamp) as last_seen
-                FROM cf_cache_responses 
-                WHERE cf_cache_status != ''
-                GROUP BY cf_cache_status
-                ORDER BY total_requests DESC
-            """)
-            
-            for row in cursor:
-                cf_status = row["cf_cache_status"]
-                stats[cf_status] = {
-                    "total_requests": row["total_requests"],
-                    "successful_requests": row["successful_requests"],
-                    "success_rate": (row["successful_requests"] / row["total_requests"]) * 100 if row["total_requests"] > 0 else 0.0,
-                    "first_seen": row["first_seen"],
-                    "last_seen": row["last_seen"]
-                }
-            
-            # Get breakdown by operation type
+        with self._read_connection() as conn:
+            # One grouped scan of the daily rollup; per-status totals are summed from the per-operation breakdown
             cursor = conn.execute("""
                 SELECT 
                     cf_cache_status,
                     operation_type,
-                    COUNT(*) as total_requests,
-                    SUM(success) as successful_requests
-                FROM cf_cache_responses 
+                    SUM(total) as total_requests,
+                    SUM(success) as successful_requests,
+                    MIN(first_seen) as first_seen,
+                    MAX(last_seen) as last_seen
+                FROM cf_cache_rollup 
                 WHERE cf_cache_status != ''
                 GROUP BY cf_cache_status, operation_type
                 ORDER BY cf_cache_status, operation_type
             """)
             
-            for row in cursor:
-                cf_status = row["cf_cache_status"]
-                op_type = row["operation_type"]
-                
-                if cf_status in stats:
-                    if "operations" not in stats[cf_status]:
-                        stats[cf_status]["operations"] = {}
-                    
-                    stats[cf_status]["operations"][op_type] = {
-                        "total_requests": row["total_requests"],
-                        "successful_requests": row["successful_requests"],
-                        "success_rate": (row["successful_requests"] / row["total_requests"]) * 100 if row["total_requests"] > 0 else 0.0
+            for cf_status, op_type, total, successes, first_seen, last_seen in cursor:
+                entry = stats.get(cf_status)
+                if entry is None:
+                    entry = stats[cf_status] = {
+                        "total_requests": 0,
+                        "successful_requests": 0,
+                        "success_rate": 0.0,
+                        "first_seen": first_seen,
+                        "last_seen": last_seen,
+                        "operations": {},
                     }
+                entry["total_requests"] += total
+                entry["successful_requests"] += successes
+                entry["first_seen"] = min(entry["first_seen"], first_seen)
+                entry["last_seen"] = max(entry["last_seen"], last_seen)
+                entry["operations"][op_type] = {
+                    "total_requests": total,
+                    "successful_requests": successes,
+                    "success_rate": (successes / total) * 100 if total > 0 else 0.0
+                }
+        
+        # Busiest status first, as the report lists them
+        for entry in stats.values():
+            entry["success_rate"] = (entry["successful_requests"] / entry["total_requests"]) * 100
+        stats = dict(sorted(stats.items(), key=lambda kv: kv[1]["total_requests"], reverse=True))
         
         return stats
 
+    def get_artist_staleness_summary(self, recheck_hours: int) -> Dict[str, float]:
+        """Aggregate artist status and staleness counters in a single query"""
+        with self._read_connection() as conn:
+            # Ages are in hours; unparseable or empty timestamps give NULL (= stale, never next)
+            row = conn.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(status = 'success'), 0),
+                    COALESCE(SUM(status = 'timeout'), 0),
+                    COALESCE(SUM(text_search_attempted != 0), 0),
+                    COALESCE(SUM(text_search_success != 0), 0),
+                    COALESCE(SUM(trim(artist_name) != ''), 0),
+                    COALESCE(SUM(:hours > 0 AND status = 'success'
+                                 AND (age IS NULL OR age >= :hours)), 0),
+                    COALESCE(SUM(:hours > 0 AND text_search_success != 0
+                                 AND (ts_age IS NULL OR ts_age >= :hours)), 0),
+                    MIN(CASE WHEN :hours > 0 AND age < :hours THEN :hours - age END),
+                    MIN(CASE WHEN :hours > 0 AND ts_age < :hours THEN :hours - ts_age END)
+                FROM (
+                    SELECT status, artist_name,
+                           text_search_attempted, text_search_success,
+                           (:now - julianday(last_checked)) * 24 AS age,
+                           (:now - julianday(text_search_last_checked)) * 24 AS ts_age
+                    FROM artists
+                )
+            """, {"hours": recheck_hours, "now": _julian_now()}).fetchone()
+
+        next_candidates = [h for h in row[8:10] if h is not None]
+        return {
+            "total": row[0],
+            "success": row[1],
+            "timeout": row[2],
+            "text_search_attempted": row[3],
+            "text_search_success": row[4],
+            "artists_with_names": row[5],
+            "stale_mbid_cache": row[6],
+            "stale_text_search": row[7],
+            "next_recheck_hours": min(next_candidates) if next_candidates else 0,
+        }
+
+    def get_release_group_staleness_summary(self, recheck_hours: int) -> Dict[str, float]:
+        """Aggregate release group status and staleness counters in a single query"""
+        with self._read_connection() as conn:
+            row = conn.execute("""
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(status = 'success'), 0),
+                    COALESCE(SUM(status = 'timeout'), 0),
+                    COALESCE(SUM(artist_cache_status = 'success'), 0),
+                    COALESCE(SUM(:hours > 0 AND status = 'success'
+                                 AND (age IS NULL OR age >= :hours)), 0),
+                    MIN(CASE WHEN :hours > 0 AND age < :hours THEN :hours - age END)
+                FROM (
+                    SELECT status, artist_cache_status,
+                           (:now - julianday(last_checked)) * 24 AS age
+                    FROM release_groups
+                )
+            """, {"hours": recheck_hours, "now": _julian_now()}).fetchone()
+
+        return {
+            "total": row[0],
+            "success": row[1],
+            "timeout": row[2],
+            "eligible": row[3],
+            "stale_entries": row[4],
+            "next_recheck_hours": row[5] if row[5] is not None else 0,
+        }
+
+
+def storage_exists(cfg: dict) -> bool:
+    """Check whether the configured ledger exists without opening it (SQLiteStorage creates its file)"""
+    if cfg.get("storage_type", "csv").lower() == "sqlite":
+        return os.path.exists(cfg.get("db_path", "mbid_cache.db"))
+    return os.path.exists(cfg.get("artists_csv_path", "mbid-artists.csv"))
+
 
 def create_storage_backend(cfg: dict) -> StorageBackend:
     """Factory function to create appropriate storage backend based on config"""
     storage_type = cfg.get("storage_type", "csv").lower()
     
     if storage_type == "sqlite":
-        return SQLiteStorage(cfg.get("db_path", "mbid_cache.db"))
+        return SQLiteStorage(cfg.get("db_path", "mbid_cache.db"), cfg.get("response_retention_days", 0))
     elif storage_type == "csv":
         return CSVStorage(
             cfg.get("artists_csv_path", "mbid-artists.csv"),
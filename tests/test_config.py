@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+import configparser
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import config  # noqa: E402
+
+# INI shapes the fast parser must read exactly as configparser does (or hand to it)
+PARSER_CASES = {
+    "equals": "[lidarr]\nbase_url = http://x:8686\napi_key = abc\n",
+    "colon": "[lidarr]\nbase_url: http://x:8686\napi_key: abc\n",
+    "first_delimiter_wins": "[a]\nurl: http://x=1\nk = v: w\n",
+    "comments": "# top\n[a]\n; semi\n  # indented\nk = v # kept\n",
+    "empty_value": "[a]\nk =\nj:\n",
+    "case_and_spaces": "[Lidarr]\n  \nAPI_Key   =   abc   \nbase url = x\n",
+    "crlf": "[a]\r\nk = v\r\n\r\n[b]\r\nj = w\r\n",
+    "continuation": "[a]\nk = first\n  second\nj = w\n",
+    "continuation_after_blank": "[a]\nk = first\n\n  second\n",
+    "indented_key": "[a]\n  k = v\n",
+    "padded_header": "[ a ]\nk = v\n",
+    "default_section": "[DEFAULT]\nk = v\n[a]\nj = w\n",
+    "no_sections": "# only a comment\n",
+    "empty": "",
+    "duplicate_section": "[a]\nk = v\n[a]\nj = w\n",
+    "duplicate_key": "[a]\nk = v\nK = w\n",
+    "missing_delimiter": "[a]\njust a line\n",
+    "key_before_section": "k = v\n[a]\n",
+    "junk_after_header": "[a] trailing\nk = v\n",
+}
+
+SAMPLE_INI = "[lidarr]\nbase_url = http://lidarr:8686\napi_key = abc123\n\n[ledger]\nstorage_type = sqlite\n"
+
+
+class IniParserTest(unittest.TestCase):
+    """parse_config_bytes must agree with configparser on every INI it accepts"""
+
+    def _configparser(self, text):
+        cp = configparser.ConfigParser(interpolation=None)
+        cp.read_string(text)
+        return {section: dict(cp.items(section)) for section in cp.sections()}
+
+    def test_matches_configparser(self):
+        for name, text in PARSER_CASES.items():
+            with self.subTest(name):
+                try:
+                    expected = self._configparser(text)
+                except configparser.Error as e:
+                    with self.assertRaises(type(e)):
+                        config.parse_config_bytes("config.ini", text.encode())
+                else:
+                    self.assertEqual(config.parse_config_bytes("config.ini", text.encode()), expected)
+
+    def test_default_config_uses_fast_path(self):
+        self.assertIsNotNone(config.parse_ini_text(config.DEFAULT_CONFIG))
+
+    def test_ini_to_toml_splits_on_first_delimiter(self):
+        toml = config.ini_to_toml(PARSER_CASES["first_delimiter_wins"])
+        self.assertIn('url = "http://x=1"', toml)
+        self.assertIn('k = "v: w"', toml)
+
+    def test_inline_comment_markers_stay_in_values(self):
+        sections = config.parse_config_bytes("config.ini", b"[lidarr]\n# whole line\napi_key = abc #123\nbase_url = http://x/;y\n")
+        self.assertEqual(sections, {"lidarr": {"api_key": "abc #123", "base_url": "http://x/;y"}})
+
+    def test_colon_delimited_config_loads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "config.ini")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(PARSER_CASES["colon"])
+            cfg, _ = config.load_config_with_issues(path)
+            config._CFG_CACHE.clear()
+        self.assertEqual(cfg["lidarr_url"], "http://x:8686")
+        self.assertEqual(cfg["api_key"], "abc")
+
+
+class LoadConfigTest(unittest.TestCase):
+    """load_config hands out one shared read-only mapping; load_config_mutable a private copy"""
+
+    def test_shared_and_mutable_configs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "config.ini")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(SAMPLE_INI)
+            shared = config.load_config(path)
+            self.assertIs(config.load_config(path), shared)
+            with self.assertRaises(TypeError):
+                shared["force_artists"] = True
+
+            mutable, issues = config.load_config_mutable(path)
+            mutable["cache_recheck_hours"] = 1
+            self.assertEqual(config.load_config(path)["cache_recheck_hours"], 72)
+            self.assertEqual(issues, config.load_config_with_issues(path)[1])
+            config._CFG_CACHE.clear()
+
+
+class SidecarTest(unittest.TestCase):
+    """The parsed-config sidecar must never hold the API key or outlive a schema change"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "config.ini")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_INI)
+        config._CFG_CACHE.clear()
+
+    def tearDown(self):
+        config._CFG_CACHE.clear()
+        self.tmp.cleanup()
+
+    def _reload(self):
+        """Load the config again as a fresh process would, reporting whether it was rebuilt"""
+        config._CFG_CACHE.clear()
+        with mock.patch.object(config, "_build_config", wraps=config._build_config) as build:
+            cfg, _ = config.load_config_with_issues(self.path)
+        return cfg, build.called
+
+    def test_api_key_is_not_written_to_sidecar(self):
+        cfg, _ = config.load_config_with_issues(self.path)
+        with open(config._sidecar_path(self.path), encoding="utf-8") as f:
+            sidecar = f.read()
+        self.assertNotIn("abc123", sidecar)
+        self.assertNotIn("api_key", json.loads(sidecar)["cfg"])
+
+        reloaded, rebuilt = self._reload()
+        self.assertFalse(rebuilt)
+        self.assertEqual(dict(reloaded), dict(cfg))
+        self.assertEqual(list(reloaded), list(cfg))
+        self.assertEqual(reloaded["api_key"], "abc123")
+
+    def test_stamp_mismatch_rebuilds_config(self):
+        config.load_config_with_issues(self.path)
+        sidecar_path = config._sidecar_path(self.path)
+        with open(sidecar_path, encoding="utf-8") as f:
+            payload = json.load(f)
+        payload["stamp"] = "0:00000000"
+        payload["cfg"]["cache_recheck_hours"] = 1
+        with open(sidecar_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+
+        reloaded, rebuilt = self._reload()
+        self.assertTrue(rebuilt)
+        self.assertEqual(reloaded["cache_recheck_hours"], 72)
+
+
+if __name__ == "__main__":
+    unittest.main()
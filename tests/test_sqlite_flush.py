@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from storage import SQLiteStorage  # noqa: E402
+
+
+class SmallQueueStorage(SQLiteStorage):
+    RESPONSE_QUEUE_LIMIT = 4
+    RESPONSE_FLUSH_SECONDS = 0.001
+    RESPONSE_FLUSH_MAX_BACKOFF = 0.008
+
+
+class FailingConnection:
+    """Stand-in writer connection whose transactions always fail"""
+
+    def __init__(self, on_enter=None):
+        self.on_enter = on_enter
+
+    def __enter__(self):
+        if self.on_enter is not None:
+            self.on_enter()
+        raise sqlite3.OperationalError("disk I/O error")
+
+    def __exit__(self, *exc):
+        return False
+
+
+class StopLoop(Exception):
+    pass
+
+
+class FlushFailureTest(unittest.TestCase):
+    """A failed flush must keep its batch queued for the next one, within bounds"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.storage = SmallQueueStorage(os.path.join(self.tmp.name, "x.db"))
+        self.storage._flusher = object()  # keep the background flusher out of the test
+        self.writer = self.storage._conn
+
+    def tearDown(self):
+        self.writer.close()
+        self.tmp.cleanup()
+
+    def _record(self, *ids):
+        for entity_id in ids:
+            self.storage.record_canary_response("artist", entity_id, "canary-a", "200", True)
+
+    def _queued(self):
+        return [row[2] for row in self.storage._canary_queue]
+
+    def test_failed_flush_requeues_rows_in_order(self):
+        self._record("0", "1", "2")
+        self.storage.record_cf_cache_response("artist", "0", "HIT", "200", True)
+        self.storage._conn = FailingConnection()
+        with self.assertRaises(sqlite3.Error):
+            self.storage.flush()
+        self.assertEqual(self._queued(), ["0", "1", "2"])
+        self.assertEqual(len(self.storage._cf_queue), 1)
+
+        self.storage._conn = self.writer
+        self.storage.flush()
+        self.assertEqual(len(self.storage._canary_queue), 0)
+        count = self.writer.execute("SELECT COUNT(*) FROM canary_responses").fetchone()[0]
+        self.assertEqual(count, 3)
+
+    def test_queue_is_bounded_with_a_single_warning(self):
+        self._record("0", "1", "2")
+        # Rows recorded while the failing transaction is open land behind the requeued batch
+        self.storage._conn = FailingConnection(on_enter=lambda: self._record("3", "4", "5"))
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            with self.assertRaises(sqlite3.Error):
+                self.storage.flush()
+            self._record("6")
+        self.assertEqual(self._queued(), ["3", "4", "5", "6"])
+        self.assertEqual(self.storage._dropped_responses, 3)
+        self.assertEqual(stderr.getvalue().count("WARNING"), 1)
+
+    def test_flush_loop_backs_off_exponentially(self):
+        delays = []
+
+        def fake_sleep(seconds):
+            delays.append(seconds)
+            if len(delays) == 5:
+                raise StopLoop
+
+        stderr = io.StringIO()
+        with mock.patch.object(self.storage, "flush", side_effect=sqlite3.OperationalError("database is locked")), \
+                mock.patch("storage.time.sleep", fake_sleep), contextlib.redirect_stderr(stderr):
+            with self.assertRaises(StopLoop):
+                self.storage._flush_loop()
+        self.assertEqual(delays, [0.002, 0.004, 0.008, 0.008, 0.008])
+        self.assertEqual(stderr.getvalue().count("WARNING"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from storage import SQLiteStorage  # noqa: E402
+
+RAW_TO_ROLLUP = (("canary_responses", "canary_rollup", "canary_target"),
+                 ("cf_cache_responses", "cf_cache_rollup", "cf_cache_status"))
+
+
+def iso_days_ago(days, minute=0):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() - days * 86400 - minute * 60)) + "+00:00"
+
+
+def open_storage(path, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SQLiteStorage(path, **kwargs)
+
+
+def raw_aggregate(conn, raw_table, key_column):
+    """The rollup rows recomputed from scratch off the raw table"""
+    return conn.execute(f"""
+        SELECT substr(timestamp, 1, 10), {key_column}, operation_type, status_code,
+               COUNT(*), SUM(success), MIN(timestamp), MAX(timestamp)
+        FROM {raw_table} GROUP BY 1, 2, 3, 4 ORDER BY 1, 2, 3, 4
+    """).fetchall()
+
+
+def rollup_rows(conn, rollup, key_column):
+    return conn.execute(f"""
+        SELECT day, {key_column}, operation_type, status_code, total, success, first_seen, last_seen
+        FROM {rollup} ORDER BY 1, 2, 3, 4
+    """).fetchall()
+
+
+# The oldest on-disk layout: basic ledger tables only, statuses as written by hand
+LEGACY_SCHEMA = """
+    CREATE TABLE artists (
+        mbid TEXT PRIMARY KEY,
+        artist_name TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT '',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_status_code TEXT NOT NULL DEFAULT '',
+        last_checked TEXT NOT NULL DEFAULT ''
+    );
+    CREATE TABLE release_groups (
+        rg_mbid TEXT PRIMARY KEY,
+        rg_title TEXT NOT NULL,
+        artist_mbid TEXT NOT NULL,
+        artist_name TEXT NOT NULL,
+        artist_cache_status TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL DEFAULT '',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_status_code TEXT NOT NULL DEFAULT '',
+        last_checked TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX idx_artists_status ON artists (status);
+    CREATE INDEX idx_rg_status ON release_groups (status);
+    INSERT INTO artists VALUES ('a1', 'Artist One', ' Success', 2, '200', '2026-10-01T00:00:00+00:00');
+    INSERT INTO artists VALUES ('a2', 'Artist Two', 'TIMEOUT', 5, '503', '');
+    INSERT INTO release_groups VALUES ('r1', 'Album', 'a1', 'Artist One', 'SUCCESS ', 'Success', 1, '200', '');
+"""
+
+
+class SchemaMigrationTest(unittest.TestCase):
+    """Old databases are brought up to SCHEMA_VERSION once, then left alone"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = os.path.join(self.tmp.name, "legacy.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+
+    def test_legacy_database_is_migrated_to_current_schema(self):
+        storage = open_storage(self.db_path)
+        conn = storage._conn
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SQLiteStorage.SCHEMA_VERSION)
+
+        artist_columns = {row[1] for row in conn.execute("PRAGMA table_info(artists)")}
+        self.assertTrue({"text_search_attempted", "text_search_success", "text_search_last_checked",
+                         "manual_entry", "last_canary_target", "last_cf_cache_status"} <= artist_columns)
+        rg_columns = {row[1] for row in conn.execute("PRAGMA table_info(release_groups)")}
+        self.assertTrue({"manual_entry", "last_canary_target", "last_cf_cache_status"} <= rg_columns)
+
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertNotIn("idx_artists_status", indexes)
+        self.assertNotIn("idx_rg_status", indexes)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertTrue({"canary_responses", "cf_cache_responses", "canary_rollup", "cf_cache_rollup"} <= tables)
+
+        artists = storage.read_artists_ledger()
+        self.assertEqual(artists["a1"]["status"], "success")
+        self.assertEqual(artists["a2"]["status"], "timeout")
+        self.assertIs(artists["a1"]["text_search_attempted"], False)
+        self.assertEqual(artists["a1"]["last_canary_target"], "")
+        rgs = storage.read_release_groups_ledger()
+        self.assertEqual((rgs["r1"]["status"], rgs["r1"]["artist_cache_status"]), ("success", "success"))
+        conn.close()
+
+    def test_current_database_skips_migrations(self):
+        open_storage(self.db_path)._conn.close()
+        with mock.patch.object(SQLiteStorage, "_migrate_schema") as migrate:
+            open_storage(self.db_path)._conn.close()
+        migrate.assert_not_called()
+
+
+class ResponseRollupTest(unittest.TestCase):
+    """Daily rollups must match the raw response tables they summarize"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = os.path.join(self.tmp.name, "x.db")
+
+    def _record_responses(self, storage):
+        codes = ["200", "200", "503", "429", "EXC:Conn"]
+        for i in range(40):
+            code = codes[i % len(codes)]
+            storage.record_canary_response("artist", str(i), f"canary-{i % 3}", code, code == "200",
+                                           ["mbid_check", "text_search"][i % 2])
+            storage.record_cf_cache_response("artist", str(i), ["HIT", "STALE", "MISS", ""][i % 4], code,
+                                             code == "200")
+
+    def test_flush_keeps_rollups_equal_to_raw_aggregates(self):
+        storage = open_storage(self.db_path)
+        storage._flusher = object()  # flush explicitly, in two batches
+        self._record_responses(storage)
+        storage.flush()
+        self._record_responses(storage)
+        storage.flush()
+        conn = storage._conn
+        for raw_table, rollup, key_column in RAW_TO_ROLLUP:
+            self.assertEqual(rollup_rows(conn, rollup, key_column), raw_aggregate(conn, raw_table, key_column))
+        conn.close()
+
+    def test_migration_backfills_rollups_from_raw_rows(self):
+        storage = open_storage(self.db_path)
+        storage._conn.close()
+        with sqlite3.connect(self.db_path) as conn:
+            for i in range(30):
+                for raw_table, _, key_column in RAW_TO_ROLLUP:
+                    conn.execute(f"""
+                        INSERT INTO {raw_table} (timestamp, entity_type, entity_id, {key_column}, status_code, success, operation_type)
+                        VALUES (?, 'artist', ?, ?, ?, ?, 'mbid_check')
+                    """, (iso_days_ago(i % 4, i), str(i), ["a", "b", ""][i % 3], ["200", "503"][i % 2], int(i % 2 == 0)))
+            # A version 3 database: raw rows, no rollups yet
+            conn.execute("DROP TABLE canary_rollup")
+            conn.execute("DROP TABLE cf_cache_rollup")
+            conn.execute("PRAGMA user_version = 3")
+        conn.close()
+
+        storage = open_storage(self.db_path)
+        conn = storage._conn
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], SQLiteStorage.SCHEMA_VERSION)
+        for raw_table, rollup, key_column in RAW_TO_ROLLUP:
+            expected = raw_aggregate(conn, raw_table, key_column)
+            self.assertTrue(expected)
+            self.assertEqual(rollup_rows(conn, rollup, key_column), expected)
+        conn.close()
+
+    def test_prune_deletes_only_rows_past_retention(self):
+        storage = open_storage(self.db_path, response_retention_days=7)
+        storage._flusher = object()
+        for days in (30, 8, 6, 0):
+            storage._canary_queue.append((iso_days_ago(days), "artist", str(days), "canary-a", "200", 1, "mbid_check"))
+            storage._cf_queue.append((iso_days_ago(days), "artist", str(days), "HIT", "200", 1, "mbid_check"))
+        storage.flush()
+        conn = storage._conn
+        rollups_before = [rollup_rows(conn, rollup, key) for _, rollup, key in RAW_TO_ROLLUP]
+
+        self.assertEqual(storage.prune_responses(), 4)
+        for raw_table, _, _ in RAW_TO_ROLLUP:
+            kept = [row[0] for row in conn.execute(f"SELECT entity_id FROM {raw_table} ORDER BY timestamp")]
+            self.assertEqual(kept, ["6", "0"])
+        # The rollups keep the pruned rows' totals
+        self.assertEqual([rollup_rows(conn, rollup, key) for _, rollup, key in RAW_TO_ROLLUP], rollups_before)
+        self.assertEqual(storage.prune_responses(), 0)
+        conn.close()
+
+    def test_prune_is_disabled_by_default(self):
+        storage = open_storage(self.db_path)
+        storage._flusher = object()
+        storage._canary_queue.append((iso_days_ago(400), "artist", "old", "canary-a", "200", 1, "mbid_check"))
+        storage.flush()
+        self.assertEqual(storage.prune_responses(), 0)
+        count = storage._conn.execute("SELECT COUNT(*) FROM canary_responses").fetchone()[0]
+        self.assertEqual(count, 1)
+        storage._conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
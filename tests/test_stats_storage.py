@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import stats  # noqa: E402
+
+
+class MissingStorageTest(unittest.TestCase):
+    """The stats report must not create ledger files it is asked to read"""
+
+    def _load(self, cfg):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            result = stats._load_report_storage(cfg)
+        return result, out.getvalue()
+
+    def test_missing_sqlite_db_is_not_created(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "missing.db")
+            result, output = self._load({"storage_type": "sqlite", "db_path": db_path})
+            self.assertIsNone(result)
+            self.assertIn("SQLite database not found", output)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_missing_csv_is_not_created(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            artists_csv = os.path.join(tmp, "mbid-artists.csv")
+            result, output = self._load({"storage_type": "csv", "artists_csv_path": artists_csv,
+                                         "release_groups_csv_path": os.path.join(tmp, "rg.csv")})
+            self.assertIsNone(result)
+            self.assertIn("Artists CSV not found", output)
+            self.assertEqual(os.listdir(tmp), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
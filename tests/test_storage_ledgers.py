@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from storage import CSVStorage, SQLiteStorage  # noqa: E402
+
+
+def artist_row(mbid, status="", name=None):
+    return {
+        "mbid": mbid, "artist_name": name if name is not None else f"Artist {mbid}", "status": status,
+        "attempts": 1, "last_status_code": "200", "last_checked": "2026-10-01T00:00:00+00:00",
+        "text_search_attempted": False, "text_search_success": False, "text_search_last_checked": "",
+        "manual_entry": False, "last_canary_target": "", "last_cf_cache_status": "",
+    }
+
+
+def rg_row(rg_mbid, status="", artist_mbid="a"):
+    return {
+        "rg_mbid": rg_mbid, "rg_title": f"Album {rg_mbid}", "artist_mbid": artist_mbid, "artist_name": "Artist",
+        "artist_cache_status": "success", "status": status, "attempts": 1, "last_status_code": "200",
+        "last_checked": "", "manual_entry": False, "last_canary_target": "", "last_cf_cache_status": "",
+    }
+
+
+class StorageCase(unittest.TestCase):
+    """Runs each test against a fresh CSV and SQLite store"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def backends(self):
+        csv_dir = os.path.join(self.tmp.name, "csv")
+        os.makedirs(csv_dir, exist_ok=True)
+        yield "csv", CSVStorage(os.path.join(csv_dir, "a.csv"), os.path.join(csv_dir, "r.csv")), "_parse_artists_csv"
+        with contextlib.redirect_stdout(io.StringIO()):
+            sqlite = SQLiteStorage(os.path.join(self.tmp.name, "x.db"))
+        self.addCleanup(lambda: sqlite._conn.close())
+        yield "sqlite", sqlite, "_query_artists_ledger"
+
+
+class LedgerCacheTest(StorageCase):
+    """Repeated reads share one parse; writes drop it so the next read sees the store"""
+
+    def test_reads_share_one_parse_until_a_write(self):
+        for name, storage, loader in self.backends():
+            with self.subTest(name):
+                storage.write_artists_ledger({"a": artist_row("a", "success")})
+                with mock.patch.object(storage, loader, wraps=getattr(storage, loader)) as load:
+                    first = storage.read_artists_ledger()
+                    self.assertIs(storage.read_artists_ledger(), first)
+                    self.assertEqual(load.call_count, 1)
+
+                    first["b"] = artist_row("b")
+                    storage.write_artists_ledger(first)
+                    self.assertNotIn("artists", storage._ledger_cache)
+                    second = storage.read_artists_ledger()
+                    self.assertEqual(load.call_count, 2)
+                self.assertIsNot(second, first)
+                self.assertEqual(sorted(second), ["a", "b"])
+                self.assertEqual([row["mbid"] for row in second.success_rows], ["a"])
+
+
+
+class DirtyRowWriteTest(StorageCase):
+    """write_*_rows persists the touched rows; only SQLite can skip the others"""
+
+    def test_row_writes(self):
+        for name, storage, _ in self.backends():
+            with self.subTest(name):
+                storage.write_artists_ledger({k: artist_row(k) for k in ("a", "b", "c")})
+                storage.write_release_groups_ledger({k: rg_row(k) for k in ("r1", "r2")})
+
+                artists = {k: artist_row(k) for k in ("a", "b", "c")}
+                artists["a"]["status"] = "Success"
+                artists["b"]["status"] = "timeout"
+                artists["c"]["attempts"] = 9  # edited but not reported as touched
+                storage.write_artists_rows(artists, ["a", "b", "a", "missing"])
+                rgs = {k: rg_row(k) for k in ("r1", "r2")}
+                rgs["r1"]["status"] = "success"
+                rgs["r2"]["attempts"] = 9
+                storage.write_release_groups_rows(rgs, ["r1"])
+
+                stored = storage.read_artists_ledger()
+                self.assertEqual(sorted(stored), ["a", "b", "c"])
+                self.assertEqual((stored["a"]["status"], stored["b"]["status"]), ("success", "timeout"))
+                stored_rgs = storage.read_release_groups_ledger()
+                self.assertEqual(stored_rgs["r1"]["status"], "success")
+                # CSV has no row-level write, so it rewrites the whole ledger it was given
+                untouched = 9 if name == "csv" else 1
+                self.assertEqual(stored["c"]["attempts"], untouched)
+                self.assertEqual(stored_rgs["r2"]["attempts"], untouched)
+
+
+class CSVReaderTest(StorageCase):
+    """The memory-mapped CSV reader must accept everything csv.DictReader did"""
+
+    def _read(self, content: bytes):
+        path = os.path.join(self.tmp.name, "artists.csv")
+        with open(path, "wb") as f:
+            f.write(content)
+        storage = CSVStorage(path, os.path.join(self.tmp.name, "rg.csv"))
+        return storage.read_artists_ledger()
+
+    def test_empty_and_header_only_files(self):
+        self.assertEqual(self._read(b""), {})
+        self.assertEqual(self._read(b"mbid,artist_name,status\r\n"), {})
+
+    def test_legacy_columns_crlf_and_quoting(self):
+        ledger = self._read(
+            "mbid,artist_name,status,attempts,last_status_code,last_checked\r\n"
+            "a,\"Sigur R\u00f3s, live\",SUCCESS,3,200,2026-10-01\r\n"
+            "b,\"Two\r\nLines\",timeout,,503,\r\n"
+            " ,Blank mbid,success,1,200,\r\n"
+            "c,Short row\r\n"
+            "d,No trailing newline,success,1,200,".encode("utf-8"))
+        self.assertEqual(sorted(ledger), ["a", "b", "c", "d"])
+        self.assertEqual(ledger["a"]["artist_name"], "Sigur R\u00f3s, live")
+        self.assertEqual((ledger["a"]["status"], ledger["a"]["attempts"]), ("success", 3))
+        self.assertEqual(ledger["b"]["artist_name"], "Two\r\nLines")
+        self.assertEqual((ledger["b"]["status"], ledger["b"]["attempts"]), ("timeout", 0))
+        self.assertEqual((ledger["c"]["artist_name"], ledger["c"]["status"]), ("Short row", ""))
+        self.assertEqual(ledger["d"]["last_checked"], "")
+        # Columns the file predates read as their defaults
+        self.assertEqual((ledger["a"]["text_search_attempted"], ledger["a"]["last_cf_cache_status"]), (False, ""))
+        self.assertEqual([row["mbid"] for row in ledger.success_rows], ["a", "d"])
+
+    def test_round_trip_through_writer(self):
+        csv_dir = os.path.join(self.tmp.name, "rt")
+        os.makedirs(csv_dir)
+        storage = CSVStorage(os.path.join(csv_dir, "a.csv"), os.path.join(csv_dir, "r.csv"))
+        rows = {k: artist_row(k, "success", name=f"N\u00e4me, \"{k}\"\nline") for k in ("x", "y")}
+        rows["y"]["text_search_success"] = True
+        storage.write_artists_ledger(rows)
+        self.assertEqual(dict(storage.read_artists_ledger()), rows)
+
+
+class SharedReaderTest(StorageCase):
+    """The SQLite reader is shared with worker threads"""
+
+    def test_reads_from_worker_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with contextlib.redirect_stdout(io.StringIO()):
+            storage = SQLiteStorage(os.path.join(self.tmp.name, "threads.db"))
+        self.addCleanup(lambda: storage._conn.close())
+        storage.write_artists_ledger({str(i): artist_row(str(i), "success") for i in range(50)})
+        storage.read_artists_ledger()  # open the reader on this thread first
+
+        def read(_):
+            storage._forget_ledger("artists")
+            return (len(storage.read_artists_ledger()),
+                    storage.get_artist_staleness_summary(72)["total"],
+                    storage.query("SELECT COUNT(*) FROM artists")[0][0])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(read, range(16)))
+        self.assertEqual(results, [(50, 50, 50)] * 16)
+
+
+if __name__ == "__main__":
+    unittest.main()